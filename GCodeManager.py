@@ -1,3 +1,7 @@
+import io
+import re
+import weakref
+
 from UM.Application import Application
 from UM.Logger import Logger
 from UM.Settings.InstanceContainer import InstanceContainer # Added import
@@ -5,6 +9,9 @@ from UM.Settings.InstanceContainer import InstanceContainer # Added import
 from .PluginConstants import PluginConstants
 from .SkewCalculator import SkewCalculator # Add this import
 
+# Matches the start of any skew command this plugin may have inserted.
+_SKEW_LINE_RE = re.compile(r"^(M852|SET_SKEW)\b")
+
 class GCodeManager:
     """Manages modifications to G-code, particularly for syncing skew compensation commands."""
     def __init__(self, application: "Application", logger: "Logger"):
@@ -19,10 +26,28 @@ class GCodeManager:
         self._logger = logger
         self._plugin_id = PluginConstants.PLUGIN_ID
         self._starg_gcode_key = PluginConstants.START_GCODE_KEY
+        self._plugin_comment = f"; {self._plugin_id}"
+        # Cache of settings containers keyed by global stack id; weak values so
+        # removed printers do not keep their containers alive.
+        self._container_cache = weakref.WeakValueDictionary()
+        # Fingerprint of the inputs of the last completed sync; identical inputs
+        # allow the whole parse/rebuild to be skipped.
+        self._last_sync_key = None
+        self._application.globalContainerStackChanged.connect(self._on_global_stack_changed)
+
+    def _on_global_stack_changed(self):
+        """Invalidates per-printer caches when the active printer changes."""
+        self._container_cache.clear()
+        self._last_sync_key = None
 
     def _find_current_settings_container(self, global_stack):
         """Helper to find the user-specific settings container."""
         active_printer_display_id = global_stack.getId()
+
+        cached_container = self._container_cache.get(active_printer_display_id)
+        if cached_container is not None:
+            return cached_container
+
         settings_container = None
 
         # Try finding printer settings container by "<global stack id>_settings" ID convention
@@ -40,7 +65,8 @@ class GCodeManager:
             else:
                 self._logger.log("w", f"{self._plugin_id}: Top container in stack is not an InstanceContainer.")
                 return None
-        
+
+        self._container_cache[active_printer_display_id] = settings_container
         return settings_container
 
     def sync_start_gcode(self, skew_calculator: "SkewCalculator", method: str, marlin_add: bool, klipper_add: bool):
@@ -83,9 +109,10 @@ class GCodeManager:
             self._logger.logException("e", f"{self._plugin_id}: Error generating skew commands: {e}")
             return # Don't modify G-code if commands can't be generated
 
-        marlin_prefix = "M852"
-        klipper_prefix = "SET_SKEW"
-        plugin_comment = f"; {self._plugin_id}"
+        # Skip the whole parse/rebuild when nothing could have changed since the last sync.
+        sync_key = (method, marlin_add, klipper_add, marlin_command, klipper_command, hash(current_start_gcode))
+        if sync_key == self._last_sync_key:
+            return
 
         # Determine which command *should* be present based on current settings
         command_to_ensure = None
@@ -94,25 +121,52 @@ class GCodeManager:
         elif method == "klipper" and klipper_add:
             command_to_ensure = klipper_command
 
-        # Filter existing lines, removing *any* skew commands previously added by this plugin
-        new_gcode_lines = []
+        # No command wanted and no plugin-tagged lines present: nothing to scan for.
+        # The substring test is a single C-level pass with no allocations.
+        if command_to_ensure is None and self._plugin_comment not in current_start_gcode:
+            self._logger.log("i", f"{self._plugin_id}: No skew command required and none present in start G-code.")
+            self._last_sync_key = sync_key
+            return
+
+        # A command is wanted and no plugin-tagged lines exist: the only possible
+        # edit is appending the command, so skip the rewrite loop entirely.
+        if command_to_ensure is not None and self._plugin_comment not in current_start_gcode:
+            if command_to_ensure in current_start_gcode:
+                self._logger.log("w", f"{self._plugin_id}: Required skew command '{command_to_ensure}' was found but potentially missing plugin comment. Not adding duplicate.")
+                self._last_sync_key = sync_key
+                return
+            trimmed_gcode = current_start_gcode.rstrip()
+            new_start_gcode = f"{trimmed_gcode}\n{command_to_ensure}" if trimmed_gcode else command_to_ensure
+            self._logger.log("i", f"{self._plugin_id}: Synchronizing start G-code skew command. Added=True, Removed=False")
+            try:
+                settings_container.setProperty(self._starg_gcode_key, "value", new_start_gcode)
+                self._logger.log("i", f"{self._plugin_id}: Successfully set start G-code in container '{settings_container.getId()}'.")
+                self._last_sync_key = sync_key[:5] + (hash(new_start_gcode),)
+            except Exception as e:
+                self._logger.logException("e", f"{self._plugin_id}: Error setting start G-code in container '{settings_container.getId()}': {e}")
+            return
+
+        # Filter existing lines, removing *any* skew commands previously added by this plugin.
+        # Stream kept lines into a single buffer instead of building a list and re-joining.
+        buffer = io.StringIO()
         command_removed = False
         lines_changed = False # Track if any line was added or removed
         existing_command_found_and_correct = False
+        kept_stripped = set() # Stripped non-plugin lines, for an O(1) duplicate test below
 
-        for line in current_start_gcode.splitlines():
+        for line in current_start_gcode.splitlines(keepends=True):
             stripped_line = line.strip()
-            # Check if the line starts with the prefix AND contains the plugin comment
-            is_marlin_skew = stripped_line.startswith(marlin_prefix) and plugin_comment in stripped_line
-            is_klipper_skew = stripped_line.startswith(klipper_prefix) and plugin_comment in stripped_line
+            # Check if the line starts with a skew command AND contains the plugin comment
+            is_plugin_skew = _SKEW_LINE_RE.match(stripped_line) is not None and self._plugin_comment in stripped_line
 
-            if not is_marlin_skew and not is_klipper_skew:
-                new_gcode_lines.append(line) # Keep non-plugin lines
+            if not is_plugin_skew:
+                buffer.write(line) # Keep non-plugin lines
+                kept_stripped.add(stripped_line)
             else:
                 # It's a skew command from this plugin
                 if command_to_ensure and stripped_line == command_to_ensure:
                     # This is the command we want, and it's already here. Keep it.
-                    new_gcode_lines.append(line)
+                    buffer.write(line)
                     existing_command_found_and_correct = True
                 else:
                     # This is an old/incorrect skew command from this plugin, or no command should be present. Remove it.
@@ -123,9 +177,11 @@ class GCodeManager:
         command_added = False
         if command_to_ensure and not existing_command_found_and_correct:
             # Double-check it's not somehow present without the comment (unlikely but safe)
-            already_present_exact = any(line.strip() == command_to_ensure for line in new_gcode_lines)
-            if not already_present_exact:
-                new_gcode_lines.append(command_to_ensure)
+            if command_to_ensure not in kept_stripped:
+                new_start_gcode = buffer.getvalue()
+                if new_start_gcode and not new_start_gcode.endswith("\n"):
+                    buffer.write("\n")
+                buffer.write(command_to_ensure)
                 command_added = True
                 lines_changed = True # Mark that a line was added
             else:
@@ -134,17 +190,22 @@ class GCodeManager:
 
         # Only set property if the gcode actually changed
         if lines_changed:
-            new_start_gcode = "\n".join(new_gcode_lines)
-            # Final check against original content, just in case logic above resulted in no net change
-            if new_start_gcode != current_start_gcode:
+            new_start_gcode = buffer.getvalue()
+            # Final check against original content, just in case logic above resulted in no net change.
+            # The length check short-circuits the full string comparison in the common case.
+            if len(new_start_gcode) != len(current_start_gcode) or new_start_gcode != current_start_gcode:
                 self._logger.log("i", f"{self._plugin_id}: Synchronizing start G-code skew command. Added={command_added}, Removed={command_removed}")
                 try:
                     # Set the property in the found settings_container
                     settings_container.setProperty(self._starg_gcode_key, "value", new_start_gcode)
                     self._logger.log("i", f"{self._plugin_id}: Successfully set start G-code in container '{settings_container.getId()}'.")
+                    # Record the key with the hash the next sync will read back.
+                    self._last_sync_key = sync_key[:5] + (hash(new_start_gcode),)
                 except Exception as e:
                     self._logger.logException("e", f"{self._plugin_id}: Error setting start G-code in container '{settings_container.getId()}': {e}")
             else:
                  self._logger.log("i", f"{self._plugin_id}: Start G-code content did not change after sync logic.")
+                 self._last_sync_key = sync_key
         else:
             self._logger.log("i", f"{self._plugin_id}: Start G-code already correctly synchronized for skew command.")
+            self._last_sync_key = sync_key
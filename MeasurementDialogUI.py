@@ -27,6 +27,10 @@ class MeasurementDialogUI(QDialog):
     # Signal emitted when calculation is done and values are saved
     calculation_done = pyqtSignal()
 
+    # Scaled pixmaps shared across dialog instances, keyed by (image_name, width, height),
+    # so reopening the dialog does not re-read and re-decode the PNGs.
+    _pixmap_cache: dict = {}
+
     def __init__(self, parent=None, controller=None) -> None:
         """
         Initializes the MeasurementDialogUI.
@@ -39,9 +43,15 @@ class MeasurementDialogUI(QDialog):
         self.setWindowTitle(catalog.i18n("Enter Measurements & Calculate Skew"))
         self.setMinimumWidth(PluginConstants.MINIMUM_DIALOG_WIDTH)
         self.setMinimumHeight(PluginConstants.MINIMUM_DIALOG_HEIGHT)
-        self.setStyleSheet(PluginConstants.DIALOG_BACKGROUND_STYLE) # Use constant
+        # One dialog-level stylesheet: the background plus a single rule for all nine
+        # measurement inputs (matched by object name), so Qt parses the QSS once
+        # instead of once per QLineEdit.
+        self.setStyleSheet(
+            f"* {{ {PluginConstants.DIALOG_BACKGROUND_STYLE} }}\n"
+            f"QLineEdit#psc_input {{ {PluginConstants.INPUT_TEXT_STYLE} }}"
+        )
 
-        self._calculator = SkewCalculator() # Local calculator for UI display/preview
+        self.__calc = None # Local calculator for UI display/preview, created on first calculation
 
         main_layout = QVBoxLayout(self)
         content_layout = QHBoxLayout() # Main content area: planes on left, results on right
@@ -64,106 +74,89 @@ class MeasurementDialogUI(QDialog):
         self.yz_bd_input = QLineEdit()
         self.yz_ad_input = QLineEdit()
 
-        self.measurement_inputs = {
-            "xy_ac": (self.xy_ac_input, "xy_ac_measurement", 141.42),
-            "xy_bd": (self.xy_bd_input, "xy_bd_measurement", 141.42),
-            "xy_ad": (self.xy_ad_input, "xy_ad_measurement", 100.0),
-            "xz_ac": (self.xz_ac_input, "xz_ac_measurement", 141.42),
-            "xz_bd": (self.xz_bd_input, "xz_bd_measurement", 141.42),
-            "xz_ad": (self.xz_ad_input, "xz_ad_measurement", 100.0),
-            "yz_ac": (self.yz_ac_input, "yz_ac_measurement", 141.42),
-            "yz_bd": (self.yz_bd_input, "yz_bd_measurement", 141.42),
-            "yz_ad": (self.yz_ad_input, "yz_ad_measurement", 100.0),
-        }
-        for key, (input_widget, _pref_key_ignored, default_val) in self.measurement_inputs.items():
+        # Structure-of-arrays layout: parallel lists iterate faster than a dict of
+        # tuples and drop the unused preference-key field.
+        self._input_keys = ["xy_ac", "xy_bd", "xy_ad",
+                            "xz_ac", "xz_bd", "xz_ad",
+                            "yz_ac", "yz_bd", "yz_ad"]
+        self._input_widgets = [self.xy_ac_input, self.xy_bd_input, self.xy_ad_input,
+                               self.xz_ac_input, self.xz_bd_input, self.xz_ad_input,
+                               self.yz_ac_input, self.yz_bd_input, self.yz_ad_input]
+        self._input_defaults = [141.42, 141.42, 100.0,
+                                141.42, 141.42, 100.0,
+                                141.42, 141.42, 100.0]
+        self._input_is_side = [key.endswith("_ad") for key in self._input_keys]
+        # Track whether inputs changed since the last successful calculation so
+        # accepting the dialog can skip a redundant recompute.
+        self._inputs_dirty = True
+        self._last_values = None
+        # Last text set on each result label, so unchanged values skip setText
+        # (and the rich-text re-parse and relayout it triggers).
+        self._last_label_text = {}
+
+        # Translate the tooltip template once; only the measurement name varies per field.
+        tooltip_template = catalog.i18n("Measured distance for {name}")
+
+        # Snapshot the controller calculator's attributes once; the input keys
+        # (e.g. "xy_ac") match the attribute names on SkewCalculator.
+        skew_calculator = getattr(self._controller, "_skew_calculator", None) if self._controller else None
+        if skew_calculator is None:
+            Logger.log("w", "MeasurementDialogUI: Controller or _skew_calculator not available for initial values, using defaults.")
+        calculator_snapshot = vars(skew_calculator) if skew_calculator is not None else {}
+
+        for key, input_widget, default_val in zip(self._input_keys, self._input_widgets, self._input_defaults):
             input_widget.setValidator(float_validator)
-            initial_value = default_val # Default fallback
-            if self._controller and hasattr(self._controller, '_skew_calculator'):
-                # 'key' from measurement_inputs (e.g., "xy_ac") matches the attribute names on SkewCalculator
-                initial_value = getattr(self._controller._skew_calculator, key, default_val)
-            else:
-                Logger.log("w", f"MeasurementDialogUI: Controller or _skew_calculator not available for initial value of {key}, using default.")
+            initial_value = calculator_snapshot.get(key, default_val)
             try:
                 input_widget.setText(f"{float(initial_value):.3f}")
             except (ValueError, TypeError):
                 input_widget.setText(f"{default_val:.3f}") # Fallback if conversion fails
-            input_widget.setToolTip(catalog.i18n(f"Measured distance for {key.upper().replace('_', ' ')}"))
-            input_widget.setStyleSheet(PluginConstants.INPUT_TEXT_STYLE) # Use constant
-
-        # --- XY Plane Group ---
-        xy_plane_group = QGroupBox(catalog.i18n("XY Plane Measurements"))
-        xy_plane_group.setStyleSheet(PluginConstants.GROUPBOX_STYLE_MEASUREMENT)
-        xy_plane_group.setFixedWidth(400)
-        xy_plane_layout = QHBoxLayout(xy_plane_group)
-        xy_input_form_layout = QFormLayout()
-        xy_input_form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        xy_input_form_layout.addRow(QLabel(catalog.i18n("AC Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xy_ac_input) # Use constant
-        xy_input_form_layout.addRow(QLabel(catalog.i18n("BD Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xy_bd_input) # Use constant
-        xy_input_form_layout.addRow(QLabel(catalog.i18n("AD Side:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xy_ad_input) # Use constant
-        xy_plane_layout.addLayout(xy_input_form_layout, 1) # Inputs take stretch factor 1
-
-        image_label_xy = QLabel()
-        self._load_image(image_label_xy, "XYpic.png", "XY Plane Diagram", (160, 240))
-        xy_plane_layout.addWidget(image_label_xy, 1) # Image takes stretch factor 1
-        planes_v_layout.addWidget(xy_plane_group)
-
-        # --- XZ Plane Group ---
-        xz_plane_group = QGroupBox(catalog.i18n("XZ Plane Measurements"))
-        xz_plane_group.setStyleSheet(PluginConstants.GROUPBOX_STYLE_MEASUREMENT)
-        xz_plane_group.setFixedWidth(400)
-        xz_plane_layout = QHBoxLayout(xz_plane_group)
-        xz_input_form_layout = QFormLayout()
-        xz_input_form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        xz_input_form_layout.addRow(QLabel(catalog.i18n("AC Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xz_ac_input) # Use constant
-        xz_input_form_layout.addRow(QLabel(catalog.i18n("BD Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xz_bd_input) # Use constant
-        xz_input_form_layout.addRow(QLabel(catalog.i18n("AD Side:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xz_ad_input) # Use constant
-        xz_plane_layout.addLayout(xz_input_form_layout, 1)
-
-        image_label_xz = QLabel()
-        self._load_image(image_label_xz, "XZpic.png", "XZ Plane Diagram", (160, 240))
-        xz_plane_layout.addWidget(image_label_xz, 1)
-        planes_v_layout.addWidget(xz_plane_group)
-
-        # --- YZ Plane Group ---
-        yz_plane_group = QGroupBox(catalog.i18n("YZ Plane Measurements"))
-        yz_plane_group.setStyleSheet(PluginConstants.GROUPBOX_STYLE_MEASUREMENT)
-        yz_plane_group.setFixedWidth(400)
-        yz_plane_layout = QHBoxLayout(yz_plane_group)
-        yz_input_form_layout = QFormLayout()
-        yz_input_form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-        yz_input_form_layout.addRow(QLabel(catalog.i18n("AC Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.yz_ac_input) # Use constant
-        yz_input_form_layout.addRow(QLabel(catalog.i18n("BD Diagonal:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.yz_bd_input) # Use constant
-        yz_input_form_layout.addRow(QLabel(catalog.i18n("AD Side:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.yz_ad_input) # Use constant
-        yz_plane_layout.addLayout(yz_input_form_layout, 1)
-
-        image_label_yz = QLabel()
-        self._load_image(image_label_yz, "YZpic.png", "YZ Plane Diagram", (160, 240))
-        yz_plane_layout.addWidget(image_label_yz, 1)
-        planes_v_layout.addWidget(yz_plane_group)
+            input_widget.setToolTip(tooltip_template.format(name=key.upper().replace('_', ' ')))
+            input_widget.setObjectName("psc_input") # Styled by the dialog-level stylesheet
+            input_widget.textEdited.connect(self._mark_dirty)
+
+        # --- Plane Groups (XY / XZ / YZ share the same structure) ---
+        ac_label = catalog.i18n("AC Diagonal:")
+        bd_label = catalog.i18n("BD Diagonal:")
+        ad_label = catalog.i18n("AD Side:")
+        planes_v_layout.addWidget(self._build_plane_group(
+            catalog.i18n("XY Plane Measurements"),
+            [(ac_label, self.xy_ac_input), (bd_label, self.xy_bd_input), (ad_label, self.xy_ad_input)],
+            "XYpic.png", "XY Plane Diagram"))
+        planes_v_layout.addWidget(self._build_plane_group(
+            catalog.i18n("XZ Plane Measurements"),
+            [(ac_label, self.xz_ac_input), (bd_label, self.xz_bd_input), (ad_label, self.xz_ad_input)],
+            "XZpic.png", "XZ Plane Diagram"))
+        planes_v_layout.addWidget(self._build_plane_group(
+            catalog.i18n("YZ Plane Measurements"),
+            [(ac_label, self.yz_ac_input), (bd_label, self.yz_bd_input), (ad_label, self.yz_ad_input)],
+            "YZpic.png", "YZ Plane Diagram"))
 
         planes_v_layout.addStretch() # Add stretch at the bottom of the planes column
         content_layout.addLayout(planes_v_layout, 2) # Planes layout takes stretch factor 2
 
         # --- Right Column: Calculated Results ---
         results_group = QGroupBox(catalog.i18n("Calculated Skew Factors & G-Code"))
-        results_group.setStyleSheet(PluginConstants.GROUPBOX_STYLE_MEASUREMENT)
+        PluginConstants.apply_style(results_group, "GROUPBOX_STYLE_MEASUREMENT")
         results_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         results_form_layout = QFormLayout()
         results_form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
 
-        self.xy_skew_factor_label = QLabel("N/A")
-        self.xz_skew_factor_label = QLabel("N/A")
-        self.yz_skew_factor_label = QLabel("N/A")
-        self.marlin_gcode_label = QLabel("N/A")
-        self.klipper_gcode_label = QLabel("N/A")
+        self.xy_skew_factor_label = QLabel("—")
+        self.xz_skew_factor_label = QLabel("—")
+        self.yz_skew_factor_label = QLabel("—")
+        self.marlin_gcode_label = QLabel("—")
+        self.klipper_gcode_label = QLabel("—")
+
+        self._result_labels = [self.xy_skew_factor_label, self.xz_skew_factor_label, self.yz_skew_factor_label,
+                               self.marlin_gcode_label, self.klipper_gcode_label]
 
         # Make labels selectable for copying and enable word wrap
-        for label in [self.xy_skew_factor_label, self.xz_skew_factor_label, self.yz_skew_factor_label,
-                      self.marlin_gcode_label, self.klipper_gcode_label]:
+        for label in self._result_labels:
             label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse | Qt.TextInteractionFlag.TextSelectableByKeyboard)
             label.setWordWrap(True)
             label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-            label.setStyleSheet(PluginConstants.RESULT_LABEL_STYLE_FORM) # Use constant
+            PluginConstants.apply_style(label, "RESULT_LABEL_STYLE_FORM") # Use constant
 
         results_form_layout.addRow(QLabel(catalog.i18n("XY Skew Factor:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xy_skew_factor_label) # Use constant
         results_form_layout.addRow(QLabel(catalog.i18n("XZ Skew Factor:"), styleSheet=PluginConstants.LABEL_STYLE_FORM), self.xz_skew_factor_label) # Use constant
@@ -187,59 +180,105 @@ class MeasurementDialogUI(QDialog):
         # Style the standard OK and Cancel buttons
         ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
         if ok_button:
-            ok_button.setStyleSheet(PluginConstants.SELECT_BUTTON_STYLE) # Use constant
+            PluginConstants.apply_style(ok_button, "SELECT_BUTTON_STYLE") # Use constant
             ok_button.setText(catalog.i18n("Apply and Close"))
             ok_button.setToolTip(catalog.i18n("Apply calculations, save measurements, and close the dialog."))
 
 
         cancel_button = button_box.button(QDialogButtonBox.StandardButton.Cancel)
         if cancel_button:
-            cancel_button.setStyleSheet(PluginConstants.CLOSE_BUTTON_STYLE) # Use constant
+            PluginConstants.apply_style(cancel_button, "CLOSE_BUTTON_STYLE") # Use constant
 
         # Rename button for clarity
         calculate_button = QPushButton(catalog.i18n("Calculate & Preview"))
-        calculate_button.setStyleSheet(PluginConstants.SELECT_BUTTON_STYLE) # Use constant
+        PluginConstants.apply_style(calculate_button, "SELECT_BUTTON_STYLE") # Use constant
         calculate_button.setToolTip(catalog.i18n("Calculate skew factors and G-code based on the entered measurements."))
         calculate_button.clicked.connect(self._calculate_and_update_display)
         button_box.addButton(calculate_button, QDialogButtonBox.ButtonRole.ActionRole)
 
         main_layout.addWidget(button_box) # Add button box to main layout
 
-        # Initial calculation and display update
-        self._calculate_and_update_display()
+        # No initial calculation: the result labels keep their placeholders until
+        # the user presses Calculate & Preview or accepts the dialog.
+
+    @property
+    def _calculator(self) -> SkewCalculator:
+        """The dialog-local SkewCalculator, constructed on first use."""
+        if self.__calc is None:
+            self.__calc = SkewCalculator()
+        return self.__calc
+
+    def _build_plane_group(self, title: str, inputs: list[tuple[str, QLineEdit]], image_file: str, description: str) -> QGroupBox:
+        """
+        Builds the groupbox for one measurement plane.
+
+        Args:
+            title (str): Translated groupbox title.
+            inputs (list[tuple[str, QLineEdit]]): (label text, input widget) rows for the form.
+            image_file (str): File name of the plane diagram in the plugin's images directory.
+            description (str): Description used for the diagram tooltip and error text.
+
+        Returns:
+            QGroupBox: The assembled plane groupbox.
+        """
+        plane_group = QGroupBox(title)
+        PluginConstants.apply_style(plane_group, "GROUPBOX_STYLE_MEASUREMENT")
+        plane_group.setFixedWidth(400)
+        plane_layout = QHBoxLayout(plane_group)
+        input_form_layout = QFormLayout()
+        input_form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        for label_text, input_widget in inputs:
+            input_form_layout.addRow(QLabel(label_text, styleSheet=PluginConstants.LABEL_STYLE_FORM), input_widget)
+        plane_layout.addLayout(input_form_layout, 1) # Inputs take stretch factor 1
+
+        image_label = QLabel()
+        self._load_image(image_label, image_file, description, (160, 240))
+        plane_layout.addWidget(image_label, 1) # Image takes stretch factor 1
+        return plane_group
 
     def _load_image(self, label: QLabel, image_name: str, description: str, dimensions: tuple[int, int]):
         """Helper function to load and set an image on a QLabel."""
         try:
+            cache_key = (image_name, dimensions[0], dimensions[1])
+            cached_pixmap = MeasurementDialogUI._pixmap_cache.get(cache_key)
+            if cached_pixmap is not None:
+                label.setPixmap(cached_pixmap)
+                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                label.setToolTip(catalog.i18n(description))
+                return
+
             # Construct path to image within the plugin's "images" directory
             image_path = os.path.join(PluginConstants.PLUGIN_PATH, "images", image_name)
-            
+
             if os.path.exists(image_path):
                 pixmap = QPixmap(image_path)
                 if not pixmap.isNull():
-                    label.setPixmap(pixmap.scaled(dimensions[0], dimensions[1], Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+                    scaled_pixmap = pixmap.scaled(dimensions[0], dimensions[1], Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                    MeasurementDialogUI._pixmap_cache[cache_key] = scaled_pixmap
+                    label.setPixmap(scaled_pixmap)
                     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                     label.setToolTip(catalog.i18n(description))
                 else:
                     Logger.log("w", f"Failed to load pixmap for {description} from: {image_path}")
-                    label.setText(catalog.i18n(f"{description} load error"))
+                    label.setText(catalog.i18n("{description} load error").format(description=description))
             else: # Should be caught by the first check, but as a safeguard
                 Logger.log("w", f"{description} image definitely not found at: {image_path}")
-                label.setText(catalog.i18n(f"{description} not found"))
+                label.setText(catalog.i18n("{description} not found").format(description=description))
         except Exception as e:
             Logger.logException("e", f"Error loading {description} image: {e}")
-            label.setText(catalog.i18n(f"{description} load error"))
+            label.setText(catalog.i18n("{description} load error").format(description=description))
 
     def _get_input_values(self) -> dict[str, float] | None:
         """Reads and validates input values, returning a dict or None if invalid."""
         values = {}
         try:
-            for key, (input_widget, _, _) in self.measurement_inputs.items():
-                text = input_widget.text().strip()
-                if not text:
-                    raise ValueError(f"Input for {key.upper()} cannot be empty.")
-                value = float(text)
-                if key.endswith("_ad") and value <= 0:
+            for key, input_widget, is_side in zip(self._input_keys, self._input_widgets, self._input_is_side):
+                try:
+                    # float() tolerates surrounding whitespace, no need to strip first
+                    value = float(input_widget.text())
+                except ValueError:
+                    raise ValueError(f"Input for {key.upper()} cannot be empty and must be a number.")
+                if is_side and value <= 0:
                      raise ValueError(f"Side measurement ({key.upper()}) must be positive.")
                 values[key] = value
             return values
@@ -249,10 +288,26 @@ class MeasurementDialogUI(QDialog):
                     message_type=Message.MessageType.ERROR).show()
             return None
 
+    def _mark_dirty(self, *_args):
+        """Flags the inputs as changed since the last successful calculation."""
+        self._inputs_dirty = True
+
+    def _set(self, label: QLabel, text: str):
+        """Sets a result label's text, skipping the call when the text is unchanged."""
+        if self._last_label_text.get(label) != text:
+            label.setText(text)
+            self._last_label_text[label] = text
+
+    def _set_all_results(self, text: str):
+        """Sets the same text on every result label."""
+        for label in self._result_labels:
+            self._set(label, text)
+
     def _on_accept(self):
         """Calculate, update controller's values, emit signal, and close."""
-        if self._calculate_and_update_display(): # Calculate one last time and check validity (uses local _calculator)
-            values = self._get_input_values() # Get values from UI fields
+        # Only recalculate if an input changed since the last successful calculation
+        if not self._inputs_dirty or self._calculate_and_update_display():
+            values = self._last_values # Cached by _calculate_and_update_display
             if values:
                 if self._controller and hasattr(self._controller, '_skew_calculator'):
                     # Update the controller's SkewCalculator instance with the new values
@@ -274,11 +329,9 @@ class MeasurementDialogUI(QDialog):
         if values is None:
             # Clear results if input is invalid
             error_html = f"<font color='{PluginConstants.ERROR_TEXT_COLOR_LIGHT_RED}'>Invalid Input</font>" # Use constant
-            self.xy_skew_factor_label.setText(error_html)
-            self.xz_skew_factor_label.setText(error_html)
-            self.yz_skew_factor_label.setText(error_html)
-            self.marlin_gcode_label.setText(error_html)
-            self.klipper_gcode_label.setText(error_html)
+            self.setUpdatesEnabled(False) # Coalesce the label updates into one repaint
+            self._set_all_results(error_html)
+            self.setUpdatesEnabled(True)
             return False
 
         try:
@@ -293,11 +346,15 @@ class MeasurementDialogUI(QDialog):
             klipper_cmd = self._calculator.get_klipper_command()
 
             # Update labels
-            self.xy_skew_factor_label.setText(f"{factors[0]:.8f}")
-            self.xz_skew_factor_label.setText(f"{factors[1]:.8f}")
-            self.yz_skew_factor_label.setText(f"{factors[2]:.8f}")
-            self.marlin_gcode_label.setText(marlin_cmd)
-            self.klipper_gcode_label.setText(klipper_cmd)
+            self.setUpdatesEnabled(False) # Coalesce the label updates into one repaint
+            self._set(self.xy_skew_factor_label, f"{factors[0]:.8f}")
+            self._set(self.xz_skew_factor_label, f"{factors[1]:.8f}")
+            self._set(self.yz_skew_factor_label, f"{factors[2]:.8f}")
+            self._set(self.marlin_gcode_label, marlin_cmd)
+            self._set(self.klipper_gcode_label, klipper_cmd)
+            self.setUpdatesEnabled(True)
+            self._inputs_dirty = False
+            self._last_values = values
             return True
 
         except Exception as e:
@@ -307,11 +364,9 @@ class MeasurementDialogUI(QDialog):
                     message_type=Message.MessageType.ERROR).show()
             # Clear results on error
             error_html = f"<font color='{PluginConstants.ERROR_TEXT_COLOR_LIGHT_RED}'>Error</font>" # Use constant
-            self.xy_skew_factor_label.setText(error_html)
-            self.xz_skew_factor_label.setText(error_html)
-            self.yz_skew_factor_label.setText(error_html)
-            self.marlin_gcode_label.setText(error_html)
-            self.klipper_gcode_label.setText(error_html)
+            self.setUpdatesEnabled(False) # Coalesce the label updates into one repaint
+            self._set_all_results(error_html)
+            self.setUpdatesEnabled(True)
             return False
 
     def reject(self):
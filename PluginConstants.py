@@ -1,104 +1,193 @@
 import os
+import sys
+import weakref
 from enum import Enum
 
+# Resolved once at import; __file__ is already absolute under normal imports,
+# so abspath (and its getcwd call) is only needed as a fallback.
+_HERE = os.path.dirname(__file__)
+if not os.path.isabs(_HERE):
+    _HERE = os.path.abspath(_HERE)
+
 class OperatingSystem(Enum):
     WINDOWS = "windows"
     LINUX = "linux"
     MACOS = "macos"
     OTHER = "other"
 
-class PluginConstants:
+def _detect_os() -> OperatingSystem:
+    """Maps sys.platform onto the OperatingSystem enum."""
+    # sys.platform is a constant set at interpreter build time, so this
+    # is a plain string compare with no syscall involved.
+    platform = sys.platform
+    if platform == "win32":
+        return OperatingSystem.WINDOWS
+    if platform == "darwin":
+        return OperatingSystem.MACOS
+    if platform.startswith("linux"):
+        return OperatingSystem.LINUX
+    return OperatingSystem.OTHER # e.g., 'java'
+
+# --- Module-level constants ---
+# Plain values live at module scope so hot paths can bind them with a single
+# LOAD_GLOBAL; the class attributes below re-export them for existing callers.
+
+# Theme colors
+DARK_BACKGROUND_COLOR = "#2d2d2d"
+TEXT_COLOR_LIGHT_GRAY = "#E0E0E0"
+TEXT_INPUT_BG_COLOR_DARK_GRAY = "#3c3c3c"
+TEXT_INPUT_BORDER_COLOR_GRAY = "#505050"
+TEXT_COLOR_HIGHLIGHTED_BG = "#1B1B1B"
+ERROR_TEXT_COLOR_LIGHT_RED = "#FF6B6B"
+GROUPBOX_BORDER_COLOR = "#BBBBBB"
+
+# Button colors
+BUTTON_PRIMARY_BG = "#0078d7"
+BUTTON_PRIMARY_HOVER_BG = "#005a9e"
+BUTTON_PRIMARY_TEXT = "#FFFFFF"
+BUTTON_PRIMARY_BORDER = "#FFFFFF"
+
+BUTTON_CLOSE_BG = "#FFFFFF"
+BUTTON_CLOSE_TEXT = "#e81123"
+BUTTON_CLOSE_BORDER = "#e81123"
+BUTTON_CLOSE_HOVER_BG = "#f4f4f4"
+
+BUTTON_SECONDARY_BORDER = "#cccccc"
+BUTTON_SECONDARY_BG = "#f9f9f9"
+BUTTON_SECONDARY_TEXT = "#333333"
+BUTTON_SECONDARY_HOVER_BG = "#e0e0e0"
+HIGHLIGHT_COLOR = "#006cc4"
+
+CURRENT_OS = _detect_os()
+
+class _LazyStyleMeta(type):
+    """Builds the multi-line stylesheet strings on first access.
+
+    The heavyweight QSS blocks are only needed once a dialog is actually
+    shown; deferring their construction keeps plugin import cheap for
+    sessions that never open the UI. The built string is stored back on the
+    class, so every later access is a plain class-dict lookup.
+    """
+    def __getattr__(cls, name):
+        builder = cls._STYLE_BUILDERS.get(name)
+        if builder is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        value = sys.intern(builder(cls))
+        setattr(cls, name, value)
+        return value
+
+class PluginConstants(metaclass=_LazyStyleMeta):
     PLUGIN_ID = "PrintSkewCompensation"
     POST_PROCESSING_SCRIPT_NAME = "PrintSkewCompensationCKM"
-    PLUGIN_PATH = os.path.dirname(os.path.abspath(__file__))
-    CALIBRATION_MODEL_PATH = os.path.join(PLUGIN_PATH, "calibration_model")
-    PLUGIN_CONFIGURATION_PATH = os.path.join(PLUGIN_PATH, "configuration")
+    PLUGIN_PATH = _HERE
+    CALIBRATION_MODEL_PATH = os.path.join(_HERE, "calibration_model")
+    PLUGIN_CONFIGURATION_PATH = os.path.join(_HERE, "configuration")
     START_GCODE_KEY = "machine_start_gcode"
 
     # --- Operating System ---
-    CURRENT_OS = None
+    # Resolved eagerly at module scope so the OS-dependent constants below
+    # fold to plain literals at import time instead of comparing against None.
+    CURRENT_OS = CURRENT_OS
 
     @staticmethod
     def get_operating_system():
-        if PluginConstants.CURRENT_OS is None:
-            os_name = os.name
-            if os_name == "nt":
-                PluginConstants.CURRENT_OS = OperatingSystem.WINDOWS
-            elif os_name == "posix":
-                try:
-                    # uname provides more detailed information on POSIX systems
-                    uname_info = os.uname()
-                    if uname_info.sysname == "Darwin":
-                        PluginConstants.CURRENT_OS = OperatingSystem.MACOS
-                    elif uname_info.sysname == "Linux":
-                        PluginConstants.CURRENT_OS = OperatingSystem.LINUX
-                    else:
-                        PluginConstants.CURRENT_OS = OperatingSystem.OTHER
-                except AttributeError:
-                    # Fallback to a generic LINUX if uname fails on a posix system.
-                    PluginConstants.CURRENT_OS = OperatingSystem.LINUX
-            else:
-                PluginConstants.CURRENT_OS = OperatingSystem.OTHER # e.g., 'java'
         return PluginConstants.CURRENT_OS
 
-    # --- Theme Colors ---
-    DARK_BACKGROUND_COLOR = "#2d2d2d"
-    TEXT_COLOR_LIGHT_GRAY = "#E0E0E0"
-    TEXT_INPUT_BG_COLOR_DARK_GRAY = "#3c3c3c"
-    TEXT_INPUT_BORDER_COLOR_GRAY = "#505050"
-    TEXT_COLOR_HIGHLIGHTED_BG = "#1B1B1B"
-    ERROR_TEXT_COLOR_LIGHT_RED = "#FF6B6B"
-    GROUPBOX_BORDER_COLOR = "#BBBBBB"
+    # Last style applied per widget; weak keys so destroyed widgets drop out.
+    _applied_styles = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def apply_style(widget, style_name: str):
+        """Sets a named style on a widget, skipping the Qt re-parse when it is already applied.
+
+        Args:
+            widget: The widget to style.
+            style_name (str): Name of a style attribute on PluginConstants.
+        """
+        style = getattr(PluginConstants, style_name)
+        if PluginConstants._applied_styles.get(widget) is style:
+            return
+        widget.setStyleSheet(style)
+        PluginConstants._applied_styles[widget] = style
+
+    # --- Theme Colors (module-level values re-exported on the class) ---
+    DARK_BACKGROUND_COLOR = DARK_BACKGROUND_COLOR
+    TEXT_COLOR_LIGHT_GRAY = TEXT_COLOR_LIGHT_GRAY
+    TEXT_INPUT_BG_COLOR_DARK_GRAY = TEXT_INPUT_BG_COLOR_DARK_GRAY
+    TEXT_INPUT_BORDER_COLOR_GRAY = TEXT_INPUT_BORDER_COLOR_GRAY
+    TEXT_COLOR_HIGHLIGHTED_BG = TEXT_COLOR_HIGHLIGHTED_BG
+    ERROR_TEXT_COLOR_LIGHT_RED = ERROR_TEXT_COLOR_LIGHT_RED
+    GROUPBOX_BORDER_COLOR = GROUPBOX_BORDER_COLOR
 
     # --- Dialog sizes ---
-    MINIMUM_DIALOG_WIDTH = 800 if CURRENT_OS == OperatingSystem.WINDOWS else 900
+    MINIMUM_DIALOG_WIDTH = 800 if CURRENT_OS is OperatingSystem.WINDOWS else 900
     MINIMUM_DIALOG_HEIGHT = 500
     MAXIMUM_DIALOG_WIDTH = 1000
-    MAXIMUM_DIALOG_HEIGHT = 650 if CURRENT_OS == OperatingSystem.WINDOWS else 720
+    MAXIMUM_DIALOG_HEIGHT = 650 if CURRENT_OS is OperatingSystem.WINDOWS else 720
 
-    HELP_PAGE_SPLIT_SIZE = [200, 500] if CURRENT_OS == OperatingSystem.WINDOWS else [250, 550]
+    # A tuple so the shared constant cannot be mutated by a caller.
+    HELP_PAGE_SPLIT_SIZE = (200, 500) if CURRENT_OS is OperatingSystem.WINDOWS else (250, 550)
 
-    # --- Button Colors ---
-    BUTTON_PRIMARY_BG = "#0078d7"
-    BUTTON_PRIMARY_HOVER_BG = "#005a9e"
-    BUTTON_PRIMARY_TEXT = "#FFFFFF"
-    BUTTON_PRIMARY_BORDER = "#FFFFFF"
+    # --- Button Colors (module-level values re-exported on the class) ---
+    BUTTON_PRIMARY_BG = BUTTON_PRIMARY_BG
+    BUTTON_PRIMARY_HOVER_BG = BUTTON_PRIMARY_HOVER_BG
+    BUTTON_PRIMARY_TEXT = BUTTON_PRIMARY_TEXT
+    BUTTON_PRIMARY_BORDER = BUTTON_PRIMARY_BORDER
 
-    BUTTON_CLOSE_BG = "#FFFFFF"
-    BUTTON_CLOSE_TEXT = "#e81123"
-    BUTTON_CLOSE_BORDER = "#e81123"
-    BUTTON_CLOSE_HOVER_BG = "#f4f4f4"
+    BUTTON_CLOSE_BG = BUTTON_CLOSE_BG
+    BUTTON_CLOSE_TEXT = BUTTON_CLOSE_TEXT
+    BUTTON_CLOSE_BORDER = BUTTON_CLOSE_BORDER
+    BUTTON_CLOSE_HOVER_BG = BUTTON_CLOSE_HOVER_BG
 
-    BUTTON_SECONDARY_BORDER = "#cccccc"
-    BUTTON_SECONDARY_BG = "#f9f9f9"
-    BUTTON_SECONDARY_TEXT = "#333333"
-    BUTTON_SECONDARY_HOVER_BG = "#e0e0e0"
-    HIGHLIGHT_COLOR = "#006cc4"
+    BUTTON_SECONDARY_BORDER = BUTTON_SECONDARY_BORDER
+    BUTTON_SECONDARY_BG = BUTTON_SECONDARY_BG
+    BUTTON_SECONDARY_TEXT = BUTTON_SECONDARY_TEXT
+    BUTTON_SECONDARY_HOVER_BG = BUTTON_SECONDARY_HOVER_BG
+    HIGHLIGHT_COLOR = HIGHLIGHT_COLOR
 
     # --- General Styles ---
-    TITLE_STYLE = f"font-size: 13px; font-weight: bold; margin-bottom: 3px; color: {TEXT_COLOR_LIGHT_GRAY};"
-    DESCRIPTION_STYLE_MENU = f"font-size: 12px; margin-bottom: 3px; color: {TEXT_COLOR_LIGHT_GRAY};"
-    DESCRIPTION_STYLE_FORM = f"font-size: 12px; margin-bottom: 3px; color: {TEXT_COLOR_LIGHT_GRAY};"
-    INPUT_TEXT_STYLE = f"background-color: {TEXT_INPUT_BG_COLOR_DARK_GRAY}; color: {TEXT_COLOR_LIGHT_GRAY}; border: 1px solid {TEXT_INPUT_BORDER_COLOR_GRAY}; border-radius: 3px; padding: 2px;"
-    LABEL_STYLE_FORM = f"color: {TEXT_COLOR_LIGHT_GRAY}; font-size: 13px"
-    RESULT_LABEL_STYLE_FORM = f"color: {TEXT_COLOR_LIGHT_GRAY}; font-size: 13px"
-    DIALOG_BACKGROUND_STYLE = f"background-color: {DARK_BACKGROUND_COLOR};"
-
-    GROUPBOX_STYLE = f'''
+    # Interned so widgets assigned the "same" style share one canonical string
+    # and Qt's stylesheet cache can hit on identity instead of re-parsing.
+    TITLE_STYLE = sys.intern(f"font-size: 13px; font-weight: bold; margin-bottom: 3px; color: {TEXT_COLOR_LIGHT_GRAY};")
+    DESCRIPTION_STYLE_MENU = sys.intern(f"font-size: 12px; margin-bottom: 3px; color: {TEXT_COLOR_LIGHT_GRAY};")
+    DESCRIPTION_STYLE_FORM = DESCRIPTION_STYLE_MENU
+    INPUT_TEXT_STYLE = sys.intern(f"background-color: {TEXT_INPUT_BG_COLOR_DARK_GRAY}; color: {TEXT_COLOR_LIGHT_GRAY}; border: 1px solid {TEXT_INPUT_BORDER_COLOR_GRAY}; border-radius: 3px; padding: 2px;")
+    LABEL_STYLE_FORM = sys.intern(f"color: {TEXT_COLOR_LIGHT_GRAY}; font-size: 13px")
+    RESULT_LABEL_STYLE_FORM = LABEL_STYLE_FORM
+    DIALOG_BACKGROUND_STYLE = sys.intern(f"background-color: {DARK_BACKGROUND_COLOR};")
+
+    GROUP_TITLE_LABEL_STYLE = sys.intern(f"color: {TEXT_COLOR_LIGHT_GRAY};")
+
+    # --- Lazily built styles ---
+    # The multi-line QSS blocks below are constructed on first access by
+    # _LazyStyleMeta; each entry maps an attribute name to its builder.
+    _STYLE_BUILDERS = {}
+
+    def _style_builder(name, _builders=_STYLE_BUILDERS):
+        def register(func):
+            _builders[name] = func
+            return func
+        return register
+
+    @_style_builder("GROUPBOX_STYLE")
+    def _build_groupbox_style(c):
+        return f'''
         QGroupBox {{
-            border: 1px solid {GROUPBOX_BORDER_COLOR};
+            border: 1px solid {c.GROUPBOX_BORDER_COLOR};
             border-radius: 5px;
         }}
     '''
 
-    GROUPBOX_STYLE_MEASUREMENT = f'''
+    @_style_builder("GROUPBOX_STYLE_MEASUREMENT")
+    def _build_groupbox_style_measurement(c):
+        return f'''
         QGroupBox {{
-            border: 1px solid {GROUPBOX_BORDER_COLOR};
+            border: 1px solid {c.GROUPBOX_BORDER_COLOR};
             border-radius: 5px;
             margin-top: 20px;
         }}
         QGroupBox::title {{
-            color: {TEXT_COLOR_LIGHT_GRAY};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
             font-size: 13px;
             font-weight: bold;
             subcontrol-origin: margin;
@@ -109,15 +198,17 @@ class PluginConstants:
     '''
 
     # --- Tooltip Style ---
-    CHECKBOX_STYLE = f'''
+    @_style_builder("CHECKBOX_STYLE")
+    def _build_checkbox_style(c):
+        return f'''
         QCheckBox {{
-            background-color: {DARK_BACKGROUND_COLOR};
-            color: {TEXT_COLOR_LIGHT_GRAY};
+            background-color: {c.DARK_BACKGROUND_COLOR};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
         }}
         QToolTip {{
-            background-color: {DARK_BACKGROUND_COLOR};
-            color: {TEXT_COLOR_LIGHT_GRAY};
-            border: 1px solid {TEXT_INPUT_BORDER_COLOR_GRAY};
+            background-color: {c.DARK_BACKGROUND_COLOR};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+            border: 1px solid {c.TEXT_INPUT_BORDER_COLOR_GRAY};
             padding: 5px;
             border-radius: 3px;
             font-size: 13px
@@ -125,33 +216,41 @@ class PluginConstants:
     '''
 
     # --- Button Styles ---
-    SELECT_BUTTON_STYLE = f'''
+    @_style_builder("SELECT_BUTTON_STYLE")
+    def _build_select_button_style(c):
+        return f'''
         QPushButton {{
             padding: 5px 10px; margin-left: 5px; margin-right: 5px;
-            background-color: {BUTTON_PRIMARY_BG}; border: 1px solid {BUTTON_PRIMARY_BORDER};
-            color: {BUTTON_PRIMARY_TEXT}; border-radius: 3px; min-width: 80px;
-        }} QPushButton:hover {{ background-color: {BUTTON_PRIMARY_HOVER_BG}; }}
+            background-color: {c.BUTTON_PRIMARY_BG}; border: 1px solid {c.BUTTON_PRIMARY_BORDER};
+            color: {c.BUTTON_PRIMARY_TEXT}; border-radius: 3px; min-width: 80px;
+        }} QPushButton:hover {{ background-color: {c.BUTTON_PRIMARY_HOVER_BG}; }}
     '''
-    CLOSE_BUTTON_STYLE = f'''
+    @_style_builder("CLOSE_BUTTON_STYLE")
+    def _build_close_button_style(c):
+        return f'''
         QPushButton {{
             padding: 5px 10px; margin-left: 5px; margin-right: 5px;
-            background-color: {BUTTON_CLOSE_BG}; border: 1px solid {BUTTON_CLOSE_BORDER};
-            color: {BUTTON_CLOSE_TEXT}; border-radius: 3px; min-width: 80px;
-        }} QPushButton:hover {{ background-color: {BUTTON_CLOSE_HOVER_BG}; }}
+            background-color: {c.BUTTON_CLOSE_BG}; border: 1px solid {c.BUTTON_CLOSE_BORDER};
+            color: {c.BUTTON_CLOSE_TEXT}; border-radius: 3px; min-width: 80px;
+        }} QPushButton:hover {{ background-color: {c.BUTTON_CLOSE_HOVER_BG}; }}
     '''
-    MEASURE_BUTTON_STYLE = f'''
+    @_style_builder("MEASURE_BUTTON_STYLE")
+    def _build_measure_button_style(c):
+        return f'''
         QPushButton {{
             padding: 5px 15px; margin-left: 5px; margin-right: 5px;
-            background-color: {BUTTON_PRIMARY_BG}; border: 1px solid {BUTTON_PRIMARY_BORDER};
-            color: {BUTTON_PRIMARY_TEXT}; border-radius: 3px; font-size: 14px
-        }} QPushButton:hover {{ background-color: {BUTTON_PRIMARY_HOVER_BG}; }}
+            background-color: {c.BUTTON_PRIMARY_BG}; border: 1px solid {c.BUTTON_PRIMARY_BORDER};
+            color: {c.BUTTON_PRIMARY_TEXT}; border-radius: 3px; font-size: 14px
+        }} QPushButton:hover {{ background-color: {c.BUTTON_PRIMARY_HOVER_BG}; }}
     '''
 
-    HELP_PAGE_STYEL = f'''
+    @_style_builder("HELP_PAGE_STYEL")
+    def _build_help_page_style(c):
+        return f'''
         QListWidget {{
-            background-color: {TEXT_INPUT_BG_COLOR_DARK_GRAY};
-            color: {TEXT_COLOR_LIGHT_GRAY};
-            border: 1px solid {GROUPBOX_BORDER_COLOR};
+            background-color: {c.TEXT_INPUT_BG_COLOR_DARK_GRAY};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+            border: 1px solid {c.GROUPBOX_BORDER_COLOR};
             padding: 5px;
         }}
         QListWidget:focus {{
@@ -161,24 +260,89 @@ class PluginConstants:
             padding: 5px;
         }}
         QListWidget::item:selected {{
-            background-color: {HIGHLIGHT_COLOR};
-            color: {BUTTON_PRIMARY_TEXT};
+            background-color: {c.HIGHLIGHT_COLOR};
+            color: {c.BUTTON_PRIMARY_TEXT};
         }}
-        QTextEdit {{
-            background-color: {TEXT_INPUT_BG_COLOR_DARK_GRAY};
-            color: {TEXT_COLOR_LIGHT_GRAY};
-            border: 1px solid {TEXT_INPUT_BORDER_COLOR_GRAY};
+        QTextEdit, QLineEdit {{
+            background-color: {c.TEXT_INPUT_BG_COLOR_DARK_GRAY};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+            border: 1px solid {c.TEXT_INPUT_BORDER_COLOR_GRAY};
             padding: 5px;
             font-size: 12px;
         }}
     '''
 
-    GROUP_TITLE_LABEL_STYLE = f"color: {TEXT_COLOR_LIGHT_GRAY};"
-    HELP_BUTTON_STYLE = f'''
+    @_style_builder("MENU_DIALOG_STYLE")
+    def _build_menu_dialog_style(c):
+        # One sheet for the whole menu dialog, scoped by type and object name,
+        # so Qt parses and polishes once instead of once per widget.
+        return f'''
+        * {{
+            background-color: {c.DARK_BACKGROUND_COLOR};
+        }}
+        QToolTip {{
+            background-color: {c.DARK_BACKGROUND_COLOR};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+            border: 1px solid {c.TEXT_INPUT_BORDER_COLOR_GRAY};
+            padding: 5px;
+            border-radius: 3px;
+            font-size: 13px
+        }}
+        QGroupBox {{
+            border: 1px solid {c.GROUPBOX_BORDER_COLOR};
+            border-radius: 5px;
+        }}
+        QCheckBox {{
+            background-color: {c.DARK_BACKGROUND_COLOR};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+        }}
+        QLabel {{
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+        }}
+        QLabel#pscDescription {{
+            font-size: 12px;
+            margin-bottom: 3px;
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+        }}
+        QTextEdit, QLineEdit {{
+            background-color: {c.TEXT_INPUT_BG_COLOR_DARK_GRAY};
+            color: {c.TEXT_COLOR_LIGHT_GRAY};
+            border: 1px solid {c.TEXT_INPUT_BORDER_COLOR_GRAY};
+            border-radius: 3px;
+            padding: 2px;
+        }}
+        QPushButton#pscSelectButton {{
+            padding: 5px 10px; margin-left: 5px; margin-right: 5px;
+            background-color: {c.BUTTON_PRIMARY_BG}; border: 1px solid {c.BUTTON_PRIMARY_BORDER};
+            color: {c.BUTTON_PRIMARY_TEXT}; border-radius: 3px; min-width: 80px;
+        }}
+        QPushButton#pscSelectButton:hover {{ background-color: {c.BUTTON_PRIMARY_HOVER_BG}; }}
+        QPushButton#pscMeasureButton {{
+            padding: 5px 15px; margin-left: 5px; margin-right: 5px;
+            background-color: {c.BUTTON_PRIMARY_BG}; border: 1px solid {c.BUTTON_PRIMARY_BORDER};
+            color: {c.BUTTON_PRIMARY_TEXT}; border-radius: 3px; font-size: 14px
+        }}
+        QPushButton#pscMeasureButton:hover {{ background-color: {c.BUTTON_PRIMARY_HOVER_BG}; }}
+        QPushButton#pscHelpButton {{
+            background-color: {c.BUTTON_PRIMARY_BG};
+            color: {c.BUTTON_PRIMARY_TEXT};
+            border: 1px solid {c.BUTTON_PRIMARY_BORDER};
+            border-radius: 7.5px;
+            min-width: 15px;
+            max-width: 15px;
+            min-height: 15px;
+            max-height: 15px;
+        }}
+        QPushButton#pscHelpButton:hover {{ background-color: {c.BUTTON_PRIMARY_HOVER_BG}; }}
+    '''
+
+    @_style_builder("HELP_BUTTON_STYLE")
+    def _build_help_button_style(c):
+        return f'''
         QPushButton {{
-            background-color: {BUTTON_PRIMARY_BG};
-            color: {BUTTON_PRIMARY_TEXT};
-            border: 1px solid {BUTTON_PRIMARY_BORDER};
+            background-color: {c.BUTTON_PRIMARY_BG};
+            color: {c.BUTTON_PRIMARY_TEXT};
+            border: 1px solid {c.BUTTON_PRIMARY_BORDER};
             border-radius: 7.5px;
             min-width: 15px;
             max-width: 15px;
@@ -186,6 +350,8 @@ class PluginConstants:
             max-height: 15px;
         }}
         QPushButton:hover {{
-            background-color: {BUTTON_PRIMARY_HOVER_BG};
+            background-color: {c.BUTTON_PRIMARY_HOVER_BG};
         }}
     '''
+
+    del _style_builder
@@ -1,3 +1,5 @@
+import functools
+import io
 import os
 import configparser
 import hashlib
@@ -8,15 +10,94 @@ from UM.i18n import i18nCatalog
 from UM.Message import Message
 from UM.Extension import Extension
 
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import QTimer, QUrl
 
-from .MeasurementDialogUI import MeasurementDialogUI
 from .SkewCalculator import SkewCalculator
-from .GCodeManager import GCodeManager
 from .PluginConstants import PluginConstants
 
+# MeasurementDialogUI and GCodeManager are imported lazily (like
+# PluginMenuDialog) to keep the plugin's share of Cura startup small.
+
 catalog = i18nCatalog("cura")
 
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_COLLAPSE_RE = re.compile(r'_+')
+
+# One coercer per settings value type; each accepts an already-typed value or
+# its string form as read back from the cfg file.
+_COERCERS = {
+    bool: lambda v: v if isinstance(v, bool) else str(v).lower() == 'true',
+    float: lambda v: v if isinstance(v, float) else float(v),
+    str: str,
+}
+
+# (enabled, method) -> (effective method, marlin flag applies, klipper flag applies).
+# Disabled or unknown combinations fall back to ("none", False, False).
+_SYNC_TABLE = {
+    (True, "marlin"): ("marlin", True, False),
+    (True, "klipper"): ("klipper", False, True),
+    (True, "postprocessing"): ("postprocessing", False, False),
+    (True, "none"): ("none", False, False),
+}
+
+# Calibration models per requested type. Paths are joined once at import, so
+# _add_calibration_model is a single dict lookup instead of a branch ladder.
+_CALIBRATION_MODELS = {
+    "xy": [("XY", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_XY.stl"))],
+    "xz": [("XZ", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_XZ.stl"))],
+    "yz": [("YZ", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_YZ.stl"))],
+}
+# "all" loads the three per-plane models; a combined STL would only duplicate
+# geometry already shipped in the individual files.
+_CALIBRATION_MODELS["all"] = _CALIBRATION_MODELS["xy"] + _CALIBRATION_MODELS["xz"] + _CALIBRATION_MODELS["yz"]
+
+# Orientation hint shown after a successful load, per model type.
+_CALIBRATION_MSGS = {
+    "xy": "Make sure the XY model is oriented flat on the build plate with the X and Y sides aligned as shown on the model.",
+    "xz": "Make sure the XZ model is oriented vertically on the build plate with X and Z sides aligned as shown on the model.",
+    "yz": "Make sure the YZ model is oriented vertically on the build plate with the Y and Z sides aligned as shown on the model.",
+    "all": "The three models are loaded individually. Make sure each one is oriented as per the axes on the model.",
+}
+
+# Notification strings resolved once at import; catalog.i18n is a gettext
+# lookup whose result never changes within a session.
+_TITLE_NEUTRAL = catalog.i18n("[Print Skew Compensation]")
+_TITLE_WARN = catalog.i18n("[Print Skew Compensation] Warning")
+_TITLE_ERR = catalog.i18n("[Print Skew Compensation] Error")
+_ERR_INVALID_TYPE = catalog.i18n("Invalid calibration model type specified.")
+_ERR_LOAD_FAILED = "Could not find or load the requested calibration model(s). Please check they exist in the plugin's 'calibration_model' folder."
+_WARN_LOAD_PARTIAL = "Some calibration models failed to load: {failed_list}"
+
+# Fixed Message kwargs per notification kind, so the branches below share one
+# construction site.
+_NOTIFY_KINDS = {
+    "neutral": {"title": _TITLE_NEUTRAL, "lifetime": 10, "message_type": Message.MessageType.NEUTRAL},
+    "warning": {"title": _TITLE_WARN},
+    "error": {"title": _TITLE_ERR, "lifetime": 10, "message_type": Message.MessageType.ERROR},
+}
+
+def _notify(kind: str, text: str, parent=None):
+    """Shows a plugin notification of the given kind ("neutral", "warning" or "error")."""
+    Message(text=text, parent=parent, **_NOTIFY_KINDS[kind]).show()
+
+@functools.lru_cache(maxsize=64)
+def _sanitized_settings_file_name(printer_name: str) -> str:
+    """Builds the per-printer cfg file name; pure in its argument, so results are memoized."""
+    safe_name = _SANITIZE_RE.sub('_', printer_name)
+    safe_name = _COLLAPSE_RE.sub('_', safe_name).strip('_')
+    # blake2s with a 4-byte digest gives the same 8-hex-char tag without
+    # computing a full 32-byte SHA-256 only to discard most of it.
+    hash_part = hashlib.blake2s(printer_name.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{safe_name}_{hash_part}.cfg"
+
+@functools.lru_cache(maxsize=64)
+def _legacy_settings_file_name(printer_name: str) -> str:
+    """The pre-blake2s (SHA-256) cfg file name, kept for migrating existing files."""
+    safe_name = _SANITIZE_RE.sub('_', printer_name)
+    safe_name = _COLLAPSE_RE.sub('_', safe_name).strip('_')
+    hash_part = hashlib.sha256(printer_name.encode('utf-8')).hexdigest()[:8]
+    return f"{safe_name}_{hash_part}.cfg"
+
 class PluginController(Extension):
     """
     Main controller for the Print Skew Compensation plugin.
@@ -25,21 +106,75 @@ class PluginController(Extension):
     and communication between different plugin components like the UI dialogs
     and the G-code manager.
     """
+    # Built once; treat as read-only and copy where callers may mutate.
+    _DEFAULT_SETTINGS = {
+        "compensation_enabled": False,
+        "compensation_method": "none",
+        "marlin_add_to_gcode": False,
+        "klipper_add_to_gcode": False,
+        "xy_ac_measurement": 141.42,
+        "xy_bd_measurement": 141.42,
+        "xy_ad_measurement": 100.0,
+        "xz_ac_measurement": 141.42,
+        "xz_bd_measurement": 141.42,
+        "xz_ad_measurement": 100.0,
+        "yz_ac_measurement": 141.42,
+        "yz_bd_measurement": 141.42,
+        "yz_ad_measurement": 100.0,
+        "pp_script_checkbox_state": False
+    }
+    # Target type per key, so coercion does not call type() on every lookup.
+    _DEFAULT_TYPES = {k: type(v) for k, v in _DEFAULT_SETTINGS.items()}
+    # Settings keys that map straight onto controller attributes.
+    _KEY_TO_ATTR = {
+        "compensation_enabled": "enabled",
+        "compensation_method": "method",
+        "marlin_add_to_gcode": "marlin_add_to_gcode",
+        "klipper_add_to_gcode": "klipper_add_to_gcode",
+        "pp_script_checkbox_state": "pp_script_checkbox_state",
+    }
+    # Settings keys feeding the calculator; stripping the trailing
+    # "_measurement" yields the matching set_measurements keyword.
+    _MEASUREMENT_KEYS = tuple(k for k in _DEFAULT_SETTINGS if k.endswith("_measurement"))
+
     def __init__(self) -> None:
         """Initializes the PluginController."""
         super().__init__()
         self._application = Application.getInstance()
         self._preferences = self._application.getPreferences()
         self._skew_calculator = SkewCalculator()
-        self._gcode_manager = GCodeManager(self._application, Logger)
         self._measurement_dialog_instance = None
         self._plugin_menu_dialog_instance = None
         self._actions = {}
+        self._menu_dialog_update_pending = False
+        # Parsed per-printer settings keyed by cfg path, validated by mtime so
+        # repeated reads skip the disk and the ConfigParser entirely.
+        self._settings_cache = {}
+        # Hash of the last serialized cfg content per path; identical content
+        # skips the disk write altogether.
+        self._last_written_hash = {}
+        # Commands cached against the calculator's measurement version, so
+        # UI-only state changes reuse them instead of reformatting.
+        self._cached_cmd_version = None
+        self._cached_marlin_cmd = None
+        self._cached_klipper_cmd = None
+        # Arguments of the last G-code sync; identical inputs skip the call.
+        self._last_sync_args = None
+        # Printer names already checked for a legacy-named cfg file.
+        self._migration_checked_names = set()
+        # (cfg path, mtime) the internal state was last built from; dialog
+        # opens skip the full re-read while the file is unchanged.
+        self._applied_state_token = None
+        # PostProcessingPlugin instance, resolved from the registry once.
+        self._pp_plugin = None
         self.pp_script_checkbox_state = False
 
         self._global_container_stack = None
+        # Active printer name, refreshed by the stack/metadata signals below so
+        # settings reads and writes avoid a Qt call per lookup.
+        self._cached_printer_name = None
         self._connect_to_global_stack_metadata()
-        Application.getInstance().globalContainerStackChanged.connect(self._handle_global_container_stack_changed)
+        self._application.globalContainerStackChanged.connect(self._handle_global_container_stack_changed)
 
         self.setMenuName(catalog.i18n("Print Skew Compensation"))
 
@@ -57,152 +192,188 @@ class PluginController(Extension):
         PluginConstants.get_operating_system()
         Logger.log("i", f"{PluginConstants.PLUGIN_ID}: PluginController Initialized for {PluginConstants.CURRENT_OS} OS.")
 
+    @functools.cached_property
+    def _gcode_manager(self):
+        """The GCodeManager, imported and constructed on first use."""
+        from .GCodeManager import GCodeManager
+        return GCodeManager(self._application, Logger)
+
     # Handlers for reading/writing printer settings
 
     def _write_printer_settings_to_file(self, printer_name, settings) -> None:
         """Writes printer settings to the plugin's configuration file for the given printer name."""
         cfg_path = self._get_printer_cfg_path(printer_name)
-        config = configparser.ConfigParser()
-        config['settings'] = {k: str(v).replace('%','%%') for k, v in settings.items()}
-        config['settings']['printer_name'] = str(printer_name).replace('%','%%')  # Store printer name for reference
-        # Check if the directory exists, create it if not (safeguard)
-        if not os.path.exists(cfg_path):
-            os.makedirs(os.path.dirname(cfg_path), exist_ok=True)
-        
+        # RawConfigParser performs no interpolation, so values need no % escaping.
+        config = configparser.RawConfigParser()
+        section = {k: str(v) for k, v in settings.items()}
+        section['printer_name'] = str(printer_name)  # Store printer name for reference
+        config['settings'] = section
+
+        # Serialize to memory first so identical content can skip the write.
+        buffer = io.StringIO()
+        config.write(buffer)
+        content = buffer.getvalue()
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if self._last_written_hash.get(cfg_path) == content_hash:
+            return
+
         try:
-            with open(cfg_path, 'w') as configfile:
-                config.write(configfile)
+            os.makedirs(os.path.dirname(cfg_path), exist_ok=True)
+            # Write to a sibling temp file and swap it in so the cfg is never
+            # observed half-written.
+            tmp_path = cfg_path + ".tmp"
+            # UTF-8 explicitly: the reader decodes as UTF-8, and the locale
+            # default would break the round trip for non-ASCII printer names.
+            with open(tmp_path, 'w', encoding='utf-8') as configfile:
+                configfile.write(content)
+            os.replace(tmp_path, cfg_path)
+            self._last_written_hash[cfg_path] = content_hash
         except Exception as e:
+            self._settings_cache.pop(cfg_path, None)
+            self._last_written_hash.pop(cfg_path, None)
             Logger.logException("e", f"{PluginConstants.PLUGIN_ID}: Error writing printer settings to file {cfg_path}: {e}")
             Message(text=catalog.i18n("An error occurred while saving printer settings."), title=catalog.i18n("[Print Skew Compensation]")).show()
             return
 
-    def _read_printer_settings_from_file(self, printer_name) -> dict:
-        """Reads printer settings from the plugin's configuration file for the given printer name."""
+        # Refresh the cache with what a read of the new file would return, so
+        # the next read is served from memory.
+        try:
+            cached_settings = {k: str(v) for k, v in settings.items()}
+            cached_settings["printer_name"] = str(printer_name)
+            self._settings_cache[cfg_path] = (os.stat(cfg_path).st_mtime_ns, cached_settings)
+        except OSError:
+            self._settings_cache.pop(cfg_path, None)
+
+    def _read_printer_settings_from_file(self, printer_name, defaults=None) -> dict:
+        """Reads printer settings from the plugin's configuration file for the given printer name.
+
+        Args:
+            printer_name: Name of the printer whose settings to read.
+            defaults: Optional read-only defaults dict returned as-is (no copy)
+                when the file is missing or malformed.
+        """
         cfg_path = self._get_printer_cfg_path(printer_name)
-        if not os.path.exists(cfg_path):
+        try:
+            file_stat = os.stat(cfg_path)
+        except (OSError, TypeError):
             Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Printer settings file does not exist: {cfg_path}. Using default settings.")
-            return self._get_default_settings()
+            return defaults if defaults is not None else self._get_default_settings()
+
+        cached = self._settings_cache.get(cfg_path)
+        if cached is not None and cached[0] == file_stat.st_mtime_ns:
+            return cached[1].copy()
+
+        # Read the whole file in one syscall and parse from memory;
+        # ConfigParser.read would swallow I/O errors and buffer line-by-line.
+        try:
+            with open(cfg_path, 'rb') as cfg_file:
+                cfg_data = cfg_file.read()
+        except OSError as e:
+            Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Could not read printer settings file {cfg_path}: {e}. Using default settings.")
+            return defaults if defaults is not None else self._get_default_settings()
 
-        config = configparser.ConfigParser()
-        config.read(cfg_path)
+        config = configparser.RawConfigParser()
+        try:
+            config.read_string(cfg_data.decode('utf-8'))
+        except (UnicodeDecodeError, configparser.Error) as e:
+            Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Could not parse printer settings file {cfg_path}: {e}. Using default settings.")
+            return defaults if defaults is not None else self._get_default_settings()
 
         if 'settings' not in config:
             Logger.log("w", f"{PluginConstants.PLUGIN_ID}: No 'settings' section found in {cfg_path}. Using default settings.")
-            return self._get_default_settings()
+            return defaults if defaults is not None else self._get_default_settings()
 
-        settings = {k: v for k, v in config['settings'].items()}
-        return settings
+        # Files written before the switch to RawConfigParser carry interpolation
+        # escapes; undo them only when actually present.
+        settings = {k: (v.replace('%%', '%') if '%%' in v else v) for k, v in config['settings'].items()}
+        self._settings_cache[cfg_path] = (file_stat.st_mtime_ns, settings)
+        return settings.copy()
 
     def _get_default_settings(self) -> dict:
-        return {
-            "compensation_enabled": False,
-            "compensation_method": "none",
-            "marlin_add_to_gcode": False,
-            "klipper_add_to_gcode": False,
-            "xy_ac_measurement": 141.42,
-            "xy_bd_measurement": 141.42,
-            "xy_ad_measurement": 100.0,
-            "xz_ac_measurement": 141.42,
-            "xz_bd_measurement": 141.42,
-            "xz_ad_measurement": 100.0,
-            "yz_ac_measurement": 141.42,
-            "yz_bd_measurement": 141.42,
-            "yz_ad_measurement": 100.0,
-            "pp_script_checkbox_state": False
-        }
+        return self._DEFAULT_SETTINGS.copy()
     
     def _get_printer_cfg_path(self, printer_name) -> str:
         """Returns the path to the plugin's printer configuration file path based on the printer name."""
         if not printer_name:
             Logger.log("e", f"{PluginConstants.PLUGIN_ID}: Printer name is empty, cannot determine config path.")
             return None
-        printer_file_name = self._sanitized_settings_file_name(printer_name)
+        printer_file_name = _sanitized_settings_file_name(printer_name)
         cfg_path = os.path.join(PluginConstants.PLUGIN_CONFIGURATION_PATH, printer_file_name)
+        self._migrate_legacy_cfg(printer_name, cfg_path)
         return cfg_path
-    
-    def _sanitized_settings_file_name(self, printer_name) -> str:
-        safe_name = re.sub(r'[^a-zA-Z0-9._-]', '_', printer_name)
-        safe_name = re.sub(r'_+', '_', safe_name).strip('_')
-        hash_part = hashlib.sha256(printer_name.encode('utf-8')).hexdigest()[:8]
-        return f"{safe_name}_{hash_part}.cfg"
+
+    def _migrate_legacy_cfg(self, printer_name, cfg_path) -> None:
+        """One-time rename of a cfg file saved under the old SHA-256 name."""
+        if printer_name in self._migration_checked_names:
+            return
+        self._migration_checked_names.add(printer_name)
+        if os.path.exists(cfg_path):
+            return
+        legacy_path = os.path.join(PluginConstants.PLUGIN_CONFIGURATION_PATH,
+                                   _legacy_settings_file_name(printer_name))
+        if os.path.exists(legacy_path):
+            try:
+                os.replace(legacy_path, cfg_path)
+                Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Migrated settings file {legacy_path} to {cfg_path}.")
+            except OSError as e:
+                Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Could not migrate legacy settings file {legacy_path}: {e}")
 
     def _get_current_printer_name(self) -> str:
-        """Returns the name of the currently active printer."""
-        stack = self._application.getGlobalContainerStack()
-        if stack:
-            return stack.getName()
-        return None
+        """Returns the cached name of the currently active printer."""
+        return self._cached_printer_name
 
     def _update_internal_state_from_printer_config(self):
         printer_name = self._get_current_printer_name()
-        default_settings = self._get_default_settings()
+        default_settings = self._DEFAULT_SETTINGS # Read-only here, no copy needed
 
         if not printer_name:
             Logger.log("w", f"{PluginConstants.PLUGIN_ID}: No printer selected, using default settings.")
             current_settings_source = default_settings # Use defaults directly, types are correct
         else:
-            current_settings_source = self._read_printer_settings_from_file(printer_name)
+            # Pass the shared defaults through so the missing-file path does not
+            # build a fresh dict just to read it back.
+            current_settings_source = self._read_printer_settings_from_file(printer_name, default_settings)
 
-        # Helper to get a value and convert if it's a string, falling back to default typed value
+        # Helper to get a value and coerce it via the per-type table, falling back to the default
+        default_types = self._DEFAULT_TYPES
         def get_typed_value(key_name, default_typed_value_from_schema):
             value_from_source = current_settings_source.get(key_name, default_typed_value_from_schema)
-            target_type = type(default_typed_value_from_schema)
-
-            if isinstance(value_from_source, str):
-                try:
-                    if target_type is bool:
-                        return value_from_source.lower() == 'true'
-                    elif target_type is float:
-                        return float(value_from_source)
-                    elif target_type is str:
-                        return value_from_source
-                    else: # Fallback for unexpected types, try direct conversion
-                        return target_type(value_from_source)
-                except ValueError:
-                    Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Invalid value '{value_from_source}' for '{key_name}'. Using default: {default_typed_value_from_schema}")
-                    return default_typed_value_from_schema
-            elif isinstance(value_from_source, target_type):
-                return value_from_source
-            else:
-                try:
-                    Logger.log("d", f"{PluginConstants.PLUGIN_ID}: Value for '{key_name}' is of type {type(value_from_source)}, attempting cast to {target_type}.")
-                    return target_type(value_from_source)
-                except Exception as e:
-                    Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Could not convert value '{value_from_source}' for '{key_name}' to {target_type}. Error: {e}. Using default: {default_typed_value_from_schema}")
-                    return default_typed_value_from_schema
-
-        self.enabled = get_typed_value("compensation_enabled", default_settings["compensation_enabled"])
-        self.method = get_typed_value("compensation_method", default_settings["compensation_method"])
-        self.marlin_add_to_gcode = get_typed_value("marlin_add_to_gcode", default_settings["marlin_add_to_gcode"])
-        self.klipper_add_to_gcode = get_typed_value("klipper_add_to_gcode", default_settings["klipper_add_to_gcode"])
-        self.pp_script_checkbox_state = get_typed_value("pp_script_checkbox_state", default_settings["pp_script_checkbox_state"])
-
-        xy_ac = get_typed_value("xy_ac_measurement", default_settings["xy_ac_measurement"])
-        xy_bd = get_typed_value("xy_bd_measurement", default_settings["xy_bd_measurement"])
-        xy_ad = get_typed_value("xy_ad_measurement", default_settings["xy_ad_measurement"])
-        xz_ac = get_typed_value("xz_ac_measurement", default_settings["xz_ac_measurement"])
-        xz_bd = get_typed_value("xz_bd_measurement", default_settings["xz_bd_measurement"])
-        xz_ad = get_typed_value("xz_ad_measurement", default_settings["xz_ad_measurement"])
-        yz_ac = get_typed_value("yz_ac_measurement", default_settings["yz_ac_measurement"])
-        yz_bd = get_typed_value("yz_bd_measurement", default_settings["yz_bd_measurement"])
-        yz_ad = get_typed_value("yz_ad_measurement", default_settings["yz_ad_measurement"])
-
-        self._skew_calculator.set_measurements(
-            xy_ac=xy_ac,
-            xy_bd=xy_bd,
-            xy_ad=xy_ad,
-            xz_ac=xz_ac,
-            xz_bd=xz_bd,
-            xz_ad=xz_ad,
-            yz_ac=yz_ac,
-            yz_bd=yz_bd,
-            yz_ad=yz_ad
-        )
-        self._update_plugin_menu_dialog_state()
+            target_type = default_types.get(key_name) or type(default_typed_value_from_schema)
+            coercer = _COERCERS.get(target_type, target_type)
+            try:
+                return coercer(value_from_source)
+            except (ValueError, TypeError) as e:
+                Logger.log("w", f"{PluginConstants.PLUGIN_ID}: Could not convert value '{value_from_source}' for '{key_name}' to {target_type}. Error: {e}. Using default: {default_typed_value_from_schema}")
+                return default_typed_value_from_schema
+
+        for key, attr in self._KEY_TO_ATTR.items():
+            setattr(self, attr, get_typed_value(key, default_settings[key]))
+
+        measurements = {key.rsplit('_', 1)[0]: get_typed_value(key, default_settings[key])
+                        for key in self._MEASUREMENT_KEYS}
+        self._skew_calculator.set_measurements(**measurements)
+        self._applied_state_token = self._current_state_token(printer_name)
+        self._schedule_menu_dialog_update()
+
+    def _current_state_token(self, printer_name):
+        """Identifies the cfg file content the internal state was built from."""
+        if not printer_name:
+            return None
+        cfg_path = self._get_printer_cfg_path(printer_name)
+        try:
+            return (cfg_path, os.stat(cfg_path).st_mtime_ns)
+        except (OSError, TypeError):
+            return (cfg_path, None)
+
+    def _refresh_state_if_stale(self):
+        """Re-reads the printer config only when the file changed since the last refresh."""
+        token = self._current_state_token(self._get_current_printer_name())
+        if token is not None and token == self._applied_state_token:
+            return
+        self._update_internal_state_from_printer_config()
 
     def _save_current_settings(self):
-        self._update_plugin_menu_dialog_state()
+        self._schedule_menu_dialog_update()
         printer_name = self._get_current_printer_name()
         if not printer_name:
             Logger.log("w", f"{PluginConstants.PLUGIN_ID}: No printer selected, cannot save settings.")
@@ -229,7 +400,7 @@ class PluginController(Extension):
 
     def _connect_to_global_stack_metadata(self):
         """Connects (or reconnects) to the global container stack's metaDataChanged signal."""
-        new_stack = Application.getInstance().getGlobalContainerStack()
+        new_stack = self._application.getGlobalContainerStack()
 
         if self._global_container_stack and self._global_container_stack != new_stack:
             try:
@@ -241,6 +412,7 @@ class PluginController(Extension):
 
 
         self._global_container_stack = new_stack
+        self._cached_printer_name = new_stack.getName() if new_stack else None
 
         if self._global_container_stack:
             try:
@@ -256,13 +428,24 @@ class PluginController(Extension):
     def _handle_global_container_stack_changed(self):
         """Handles the global container stack changing."""
         Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Global container stack has changed. Re-evaluating metadata listener connection.")
+        self._last_sync_args = None # New printer: force the next sync through
         self._connect_to_global_stack_metadata()
 
     def _on_global_metadata_changed(self): # Signature changed: no key argument
         """Handles changes to the global container stack's metadata."""
-        self._update_plugin_menu_dialog_state()
+        # A rename arrives as a metadata change, so refresh the cached name.
+        if self._global_container_stack:
+            self._cached_printer_name = self._global_container_stack.getName()
+        self._schedule_menu_dialog_update()
+
+    # Preference keys the plugin cares about; anything else is ignored early.
+    _RELEVANT_PREF_PREFIXES = (PluginConstants.PLUGIN_ID,)
 
-    def _on_preference_changed(self, *args):  # Add *args to accept any additional arguments
+    def _on_preference_changed(self, key: str = "", *_):
+        # Cura emits this for every preference; skip the file read and the 14
+        # coercions unless the changed key belongs to this plugin.
+        if key and not key.startswith(self._RELEVANT_PREF_PREFIXES):
+            return
         self._update_internal_state_from_printer_config()
 
     def _show_plugin_menu_dialog(self):
@@ -275,7 +458,7 @@ class PluginController(Extension):
         # --- End check ---
 
         if self._plugin_menu_dialog_instance is not None and self._plugin_menu_dialog_instance.isVisible():
-            self._update_plugin_menu_dialog_state()
+            self._schedule_menu_dialog_update()
             self._plugin_menu_dialog_instance.raise_()
             self._plugin_menu_dialog_instance.activateWindow()
             return
@@ -300,33 +483,79 @@ class PluginController(Extension):
 
         self._plugin_menu_dialog_instance.finished.connect(self._on_plugin_menu_dialog_finished)
 
-        self._update_internal_state_from_printer_config()
+        self._refresh_state_if_stale()
+        self._schedule_menu_dialog_update()
         self._plugin_menu_dialog_instance.show()
         self._plugin_menu_dialog_instance.activateWindow()
 
+    def _schedule_menu_dialog_update(self):
+        """Coalesces dialog-state refreshes into at most one per event-loop turn.
+
+        A single user toggle can trigger several save/sync cascades; deferring
+        the refresh with a zero-timeout timer collapses them into one run of
+        the expensive G-code and script synchronization.
+        """
+        if self._menu_dialog_update_pending:
+            return
+        self._menu_dialog_update_pending = True
+        QTimer.singleShot(0, self._run_scheduled_menu_dialog_update)
+
+    def _run_scheduled_menu_dialog_update(self):
+        self._menu_dialog_update_pending = False
+        self._update_plugin_menu_dialog_state()
+
     def _update_plugin_menu_dialog_state(self):
-        if self._plugin_menu_dialog_instance:
-            marlin_command = self._skew_calculator.get_marlin_command()
-            klipper_command = self._skew_calculator.get_klipper_command()
-
-            marlin_active = self.enabled and self.method == "marlin" and self.marlin_add_to_gcode
-            klipper_active = self.enabled and self.method == "klipper" and self.klipper_add_to_gcode
-            pp_script_active = self.enabled and self.method == "postprocessing" and self.pp_script_checkbox_state
-            self._ensure_pp_script_state(pp_script_active)
-            self._sync_gcode_based_on_state()
-
-            self._plugin_menu_dialog_instance.update_display(
-                marlin_gcode=marlin_command,
-                klipper_gcode=klipper_command,
-                is_enabled=self.enabled,
-                is_pp_script_active=pp_script_active,
-                marlin_method_active=marlin_active,
-                klipper_method_active=klipper_active
-            )
+        self._sync_side_effects()
+        self._refresh_dialog_labels()
+
+    def _sync_side_effects(self):
+        """Applies the non-UI consequences of the current state (PP script, start G-code)."""
+        pp_script_active = self.enabled and self.method == "postprocessing" and self.pp_script_checkbox_state
+        self._ensure_pp_script_state(pp_script_active)
+        self._sync_gcode_based_on_state()
+
+    def _refresh_dialog_labels(self):
+        """Pushes command strings and toggle states to the menu dialog, if it is showing.
+
+        Skipped entirely when the dialog is closed or hidden; command
+        formatting and the update_display round-trip only matter on screen.
+        """
+        dialog = self._plugin_menu_dialog_instance
+        if dialog is None or not dialog.isVisible():
+            return
+
+        measurement_version = self._skew_calculator._measurement_version
+        if measurement_version != self._cached_cmd_version:
+            self._cached_marlin_cmd = self._skew_calculator.get_marlin_command()
+            self._cached_klipper_cmd = self._skew_calculator.get_klipper_command()
+            self._cached_cmd_version = measurement_version
+
+        marlin_active = self.enabled and self.method == "marlin" and self.marlin_add_to_gcode
+        klipper_active = self.enabled and self.method == "klipper" and self.klipper_add_to_gcode
+        pp_script_active = self.enabled and self.method == "postprocessing" and self.pp_script_checkbox_state
+
+        dialog.update_display(
+            marlin_gcode=self._cached_marlin_cmd,
+            klipper_gcode=self._cached_klipper_cmd,
+            is_enabled=self.enabled,
+            is_pp_script_active=pp_script_active,
+            marlin_method_active=marlin_active,
+            klipper_method_active=klipper_active,
+            active_printer_name=self._cached_printer_name
+        )
+
+    def _get_pp_plugin(self):
+        """Returns the PostProcessingPlugin instance, resolving it from the registry once."""
+        if self._pp_plugin is None:
+            try:
+                self._pp_plugin = self._application.getPluginRegistry().getPluginObject("PostProcessingPlugin")
+            except Exception as e:
+                Logger.logException("e", f"{PluginConstants.PLUGIN_ID}: Error resolving PostProcessingPlugin from registry: {e}")
+        return self._pp_plugin
 
     def _is_post_processing_script_active(self) -> bool:
         try:
-            post_processing_plugin = Application.getInstance().getPluginRegistry().getPluginObject("PostProcessingPlugin")
+            post_processing_plugin = self._get_pp_plugin()
             if post_processing_plugin:
                 active_script_keys = post_processing_plugin.scriptList
                 is_active = PluginConstants.POST_PROCESSING_SCRIPT_NAME in active_script_keys
@@ -344,29 +573,30 @@ class PluginController(Extension):
         script_key = PluginConstants.POST_PROCESSING_SCRIPT_NAME
         Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Ensuring PP script '{script_key}' state is {target_state}.")
         try:
-            post_processing_plugin = Application.getInstance().getPluginRegistry().getPluginObject("PostProcessingPlugin")
+            post_processing_plugin = self._get_pp_plugin()
             if not post_processing_plugin:
                 Logger.log("e", f"{PluginConstants.PLUGIN_ID}: Could not get PostProcessingPlugin instance to ensure script state.")
                 return False
 
-            current_index = -1
             active_script_keys = post_processing_plugin.scriptList
-            for idx, script in enumerate(active_script_keys):
-                if script == script_key:
-                    current_index = idx
-                    break
-            is_currently_active = current_index != -1
+            try:
+                current_index = active_script_keys.index(script_key)
+                is_currently_active = True
+            except ValueError:
+                current_index = -1
+                is_currently_active = False
 
             if target_state and not is_currently_active:
                 loaded_scripts = post_processing_plugin.loadedScriptList
                 if script_key in loaded_scripts:
                     post_processing_plugin.addScriptToList(script_key)
-                    post_processing_plugin.writeScriptsToStack()
                     active_script_keys = post_processing_plugin.scriptList
-                    current_index = len(active_script_keys) - 1
                     # Move the newly added script to index 0, one step at a time
+                    # (moveScript only swaps adjacent entries), then persist the
+                    # reordered list to the stack once.
                     for current_index in range(len(active_script_keys) - 1, 0, -1):
                         post_processing_plugin.moveScript(current_index, current_index - 1)
+                    post_processing_plugin.writeScriptsToStack()
                     Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Added script '{script_key}' to active post-processing list.")
                     return True
                 else:
@@ -390,18 +620,19 @@ class PluginController(Extension):
     def _sync_gcode_based_on_state(self):
         """Syncs start G-code based on the current internal state."""
 
-        # Determine effective method and add flags based on enabled status
-        effective_method = "none"
-        add_marlin = False
-        add_klipper = False
-
-        if self.enabled:
-            effective_method = self.method
-            if self.method == "marlin" and self.marlin_add_to_gcode:
-                add_marlin = True
-            elif self.method == "klipper" and self.klipper_add_to_gcode:
-                add_klipper = True
-            # If method is 'none' or the specific add flag is false, flags remain False
+        # Determine effective method and add flags from the decision table
+        effective_method, marlin_applies, klipper_applies = _SYNC_TABLE.get(
+            (self.enabled, self.method), ("none", False, False))
+        add_marlin = marlin_applies and self.marlin_add_to_gcode
+        add_klipper = klipper_applies and self.klipper_add_to_gcode
+
+        # The sync scans the whole start G-code; skip it when neither the
+        # decision nor the measurements moved since the last call.
+        sync_args = (effective_method, add_marlin, add_klipper,
+                     self._skew_calculator._measurement_version)
+        if sync_args == self._last_sync_args:
+            return
+        self._last_sync_args = sync_args
 
         self._gcode_manager.sync_start_gcode(
             self._skew_calculator,
@@ -513,6 +744,15 @@ class PluginController(Extension):
             self._measurement_dialog_instance.activateWindow()
             return
 
+        try:
+            from .MeasurementDialogUI import MeasurementDialogUI
+        except ImportError as e:
+            Logger.logException("e", f"{PluginConstants.PLUGIN_ID}: Could not import MeasurementDialogUI: {e}")
+            Message(text=f"Could not load the measurement dialog component.\nError: {e}",
+                    title=catalog.i18n("[Print Skew Compensation Plugin Error]"),
+                    message_type=Message.MessageType.ERROR).show()
+            return
+
         self._measurement_dialog_instance = MeasurementDialogUI(controller=self)
         self._measurement_dialog_instance.calculation_done.connect(self._on_dialog_settings_saved)
         self._measurement_dialog_instance.finished.connect(self._on_dialog_finished)
@@ -532,18 +772,27 @@ class PluginController(Extension):
             )
         else:
             self._gcode_manager.sync_start_gcode(self._skew_calculator, "none", False, False)
-        self._update_plugin_menu_dialog_state()
+        self._schedule_menu_dialog_update()
 
     def _on_dialog_finished(self, result):
         Logger.log("i", f"Measurement dialog finished with result: {result}")
         self._measurement_dialog_instance = None
 
+    # QUrl objects per model path; the calibration paths are fixed, so repeated
+    # "Add Model" clicks reuse them instead of re-parsing the path.
+    _model_url_cache = {}
+
     def _load_single_model(self, model_path: str) -> bool:
-        if not os.path.exists(model_path):
+        try:
+            os.stat(model_path)
+        except OSError:
             Logger.log("e", f"Calibration model file not found: {model_path}")
             return False
         try:
-            file_url = QUrl.fromLocalFile(model_path)
+            file_url = self._model_url_cache.get(model_path)
+            if file_url is None:
+                file_url = QUrl.fromLocalFile(model_path)
+                self._model_url_cache[model_path] = file_url
             success = self._application.readLocalFile(file_url)
             if success:
                 Logger.log("i", f"readLocalFile returned True for: {model_path}")
@@ -555,48 +804,36 @@ class PluginController(Extension):
             return False
 
     def _add_calibration_model(self, model_type: str):
-        models_to_load = []
-        msg_text = ""
-        if model_type == "xy":
-            models_to_load.append(("XY", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_XY.stl")))
-            msg_text = "Make sure the XY model is oriented flat on the build plate with the X and Y sides aligned as shown on the model."
-        elif model_type == "xz":
-            models_to_load.append(("XZ", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_XZ.stl")))
-            msg_text = "Make sure the XZ model is oriented vertically on the build plate with X and Z sides aligned as shown on the model."
-        elif model_type == "yz":
-            models_to_load.append(("YZ", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "Skew_Model_YZ.stl")))
-            msg_text = "Make sure the YZ model is oriented vertically on the build plate with the Y and Z sides aligned as shown on the model."
-        elif model_type == "all":
-            models_to_load.append(("All", os.path.join(PluginConstants.CALIBRATION_MODEL_PATH, "All_Skew_Models.stl")))
-            msg_text = "The models should come in oriented as required. Make sure they are oriented as per the axes on each model."
-        else:
+        models_to_load = _CALIBRATION_MODELS.get(model_type)
+        if models_to_load is None:
             Logger.log("e", f"Invalid model type specified: {model_type}")
-            Message(text=catalog.i18n("Invalid calibration model type specified."), lifetime=10, title=catalog.i18n("[Print Skew Compensation] Error")).show()
+            _notify("error", _ERR_INVALID_TYPE)
             return
+        msg_text = _CALIBRATION_MSGS[model_type]
 
         success_count = 0
         failed_models = []
         total_expected = len(models_to_load)
 
+        # readLocalFile only enqueues a Cura read job and returns, so this loop
+        # never blocks on disk I/O; multi-model loads already overlap inside
+        # Cura's job queue. A plugin-side thread pool would add setup cost and
+        # move a Qt call off the main thread for no gain.
         for name, path in models_to_load:
             if self._load_single_model(path):
                 success_count += 1
             else:
                 failed_models.append(name)
 
-        parent_widget = self._measurement_dialog_instance if self._measurement_dialog_instance and self._measurement_dialog_instance.isVisible() else None
         if success_count == total_expected:
-            Message(text=msg_text,
-                    lifetime=10,
-                    title=catalog.i18n("[Print Skew Compensation]"),
-                    message_type=Message.MessageType.NEUTRAL).show()
+            _notify("neutral", msg_text)
         elif success_count > 0:
+            # Only the partial-failure warning anchors to the measurement
+            # dialog, so the isVisible() probe is confined to this branch.
+            dlg = self._measurement_dialog_instance
+            parent_widget = dlg if dlg is not None and dlg.isVisible() else None
             Logger.log("w", f"Initiated loading for {success_count}/{total_expected} model(s) of type '{model_type}', but failed for: {', '.join(failed_models)}")
-            Message(text=("Some calibration models failed to load: {failed_list}").format(failed_list=', '.join(failed_models)), title=catalog.i18n("[Print Skew Compensation] Warning"), parent=parent_widget).show()
+            _notify("warning", _WARN_LOAD_PARTIAL.format(failed_list=', '.join(failed_models)), parent=parent_widget)
         else:
             Logger.log("e", f"Failed to initiate loading for any calibration models of type '{model_type}'. Failed: {', '.join(failed_models)}")
-            Message(
-                    text="Could not find or load the requested calibration model(s). Please check they exist in the plugin's 'calibration_model' folder.",
-                    lifetime=10,
-                    title=catalog.i18n("[Print Skew Compensation] Error"),
-                    message_type=Message.MessageType.ERROR).show()
+            _notify("error", _ERR_LOAD_FAILED)
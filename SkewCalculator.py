@@ -1,6 +1,7 @@
 from UM.Logger import Logger
 from .PluginConstants import PluginConstants
 import math
+import numpy as np
 
 class SkewCalculator:
     """
@@ -12,22 +13,33 @@ class SkewCalculator:
     It then computes skew factors for each plane and can generate
     Marlin (M852) and Klipper (SET_SKEW) G-code commands.
     """
+    # Ideal (skew-free) AC, BD and AD distances for one plane of the
+    # calibration object; shared by __init__ and the bad-input fallback.
+    _DEFAULT_MEASUREMENTS = (141.42, 141.42, 100.0)
+    # Row labels of the measurement matrix, used in warning logs.
+    _PLANES = ("XY", "XZ", "YZ")
+
     def __init__(self) -> None:
         """
         Initializes the SkewCalculator with default measurement values (typically representing an ideal print).
         """
-        self.xy_ac = 141.42
-        self.xy_bd = 141.42
-        self.xy_ad = 100.0
-        self.xz_ac = 141.42
-        self.xz_bd = 141.42
-        self.xz_ad = 100.0
-        self.yz_ac = 141.42
-        self.yz_bd = 141.42
-        self.yz_ad = 100.0
+        self.xy_ac, self.xy_bd, self.xy_ad = self._DEFAULT_MEASUREMENTS
+        self.xz_ac, self.xz_bd, self.xz_ad = self._DEFAULT_MEASUREMENTS
+        self.yz_ac, self.yz_bd, self.yz_ad = self._DEFAULT_MEASUREMENTS
+        # 3x3 float64 matrix (rows XY/XZ/YZ, columns ac/bd/ad) mirroring the
+        # named attributes; calculate_skew_factors works on this in one
+        # vectorized pass.
+        self._m = np.array((self._DEFAULT_MEASUREMENTS,) * 3, dtype=np.float64)
         self.marlin_I = 0.0
         self.marlin_J = 0.0
         self.marlin_K = 0.0
+        # Bumped on every set_measurements; callers caching derived commands
+        # compare against it to detect staleness.
+        self._measurement_version = 0
+        # Formatted command strings, invalidated whenever measurements change;
+        # UI refreshes between changes reuse them instead of re-formatting.
+        self._marlin_cmd_cache = None
+        self._klipper_cmd_cache = None
         self.calculate_skew_factors() # Initial calculation
 
     def set_measurements(
@@ -50,53 +62,51 @@ class SkewCalculator:
             yz_bd (float): Measured distance BD in the YZ plane.
             yz_ad (float): Measured distance AD (side length) in the YZ plane.
         """
-        self.xy_ac = xy_ac
-        self.xy_bd = xy_bd
-        self.xy_ad = xy_ad
-        self.xz_ac = xz_ac
-        self.xz_bd = xz_bd
-        self.xz_ad = xz_ad
-        self.yz_ac = yz_ac
-        self.yz_bd = yz_bd
-        self.yz_ad = yz_ad
+        # Coerce once here so every downstream consumer (factor calculation,
+        # command formatting) can rely on typed floats without re-converting.
+        try:
+            (self.xy_ac, self.xy_bd, self.xy_ad,
+             self.xz_ac, self.xz_bd, self.xz_ad,
+             self.yz_ac, self.yz_bd, self.yz_ad) = (
+                float(xy_ac), float(xy_bd), float(xy_ad),
+                float(xz_ac), float(xz_bd), float(xz_ad),
+                float(yz_ac), float(yz_bd), float(yz_ad))
+        except (ValueError, TypeError) as e:
+            Logger.log("w", f"Invalid measurement value: {e}. Falling back to ideal defaults.")
+            self.xy_ac, self.xy_bd, self.xy_ad = self._DEFAULT_MEASUREMENTS
+            self.xz_ac, self.xz_bd, self.xz_ad = self._DEFAULT_MEASUREMENTS
+            self.yz_ac, self.yz_bd, self.yz_ad = self._DEFAULT_MEASUREMENTS
+        self._m[:] = ((self.xy_ac, self.xy_bd, self.xy_ad),
+                      (self.xz_ac, self.xz_bd, self.xz_ad),
+                      (self.yz_ac, self.yz_bd, self.yz_ad))
+        self._measurement_version += 1
+        self._marlin_cmd_cache = None
+        self._klipper_cmd_cache = None
         self.calculate_skew_factors()
 
     def calculate_skew_factors(self):
         """
         Calculates the skew factors for all three planes (XY, XZ, YZ)
-        using the current measurement values.
+        in one vectorized pass over the measurement matrix.
         """
-        try:
-            AC = float(self.xy_ac)
-            BD = float(self.xy_bd)
-            AD = float(self.xy_ad)
-            if AD <= 0: raise ValueError("AD distance must be positive")
-            self.marlin_I = (AC**2 - BD**2) / (4 * AD**2)
-        except (ValueError, TypeError, ZeroDivisionError) as e:
-            Logger.log("w", f"Could not calculate Marlin I factor (XY): {e}. Using 0.0")
-            self.marlin_I = 0.0
-
-        try:
-            AC = float(self.xz_ac)
-            BD = float(self.xz_bd)
-            AD = float(self.xz_ad)
-            if AD <= 0: raise ValueError("AD distance must be positive")
-            self.marlin_J = (AC**2 - BD**2) / (4 * AD**2) if AD != 0 else 0.0
-        except (ValueError, TypeError, ZeroDivisionError) as e:
-            Logger.log("w", f"Could not calculate Marlin J factor (XZ): {e}. Using 0.0")
-            self.marlin_J = 0.0
-
-        try:
-            AC = float(self.yz_ac)
-            BD = float(self.yz_bd)
-            AD = float(self.yz_ad)
-            if AD <= 0: raise ValueError("AD distance must be positive")
-            self.marlin_K = (AC**2 - BD**2) / (4 * AD**2) if AD != 0 else 0.0
-        except (ValueError, TypeError, ZeroDivisionError) as e:
-            Logger.log("w", f"Could not calculate Marlin K factor (YZ): {e}. Using 0.0")
-            self.marlin_K = 0.0
-
-        Logger.log("i", f"Calculated Marlin Factors: I={self.marlin_I:.8f}, J={self.marlin_J:.8f}, K={self.marlin_K:.8f}")
+        ac = self._m[:, 0]
+        bd = self._m[:, 1]
+        ad = self._m[:, 2]
+        valid = ad > 0.0
+        if not valid.all():
+            bad = ", ".join(plane for plane, ok in zip(self._PLANES, valid) if not ok)
+            Logger.log("w", f"AD distance must be positive; using factor 0.0 for plane(s): {bad}")
+        # The substituted denominator keeps the division warning-free on
+        # invalid rows; np.where then zeroes their factors.
+        denom = np.where(valid, 4.0 * ad * ad, 1.0)
+        factors = np.where(valid, (ac * ac - bd * bd) / denom, 0.0)
+        self.marlin_I, self.marlin_J, self.marlin_K = factors.tolist()
+        # Immutable, so get_skew_factors can hand the same tuple to every
+        # caller instead of allocating a fresh one per UI refresh.
+        new_factors = (self.marlin_I, self.marlin_J, self.marlin_K)
+        if new_factors != getattr(self, "_factors_tuple", None):
+            Logger.log("i", f"Calculated Marlin Factors: I={self.marlin_I:.8f}, J={self.marlin_J:.8f}, K={self.marlin_K:.8f}")
+        self._factors_tuple = new_factors
 
     def _calculate_skew_factor(self, ac: float, bd: float, ad: float) -> float:
         """
@@ -114,15 +124,11 @@ class SkewCalculator:
         Returns:
             float: The calculated skew factor, or 0.0 if inputs are invalid.
         """
-        try:
-            if ad == 0:
-                return 0.0
-            skew_factor = (ac**2 - bd**2) / (2 * ad**2)
-            # Clamp value to prevent math domain error in acos
-            skew_factor = max(-1.0, min(1.0, skew_factor))
-            return math.acos(skew_factor) / math.pi * 180.0
-        except (ValueError, TypeError):
+        if not (isinstance(ad, (int, float)) and ad != 0):
             return 0.0
+        # Clamp value to prevent math domain error in acos
+        skew_factor = max(-1.0, min(1.0, (ac * ac - bd * bd) / (2.0 * ad * ad)))
+        return math.degrees(math.acos(skew_factor))
 
     def get_skew_factors(self) -> tuple[float, float, float]:
         """
@@ -132,7 +138,7 @@ class SkewCalculator:
             tuple[float, float, float]: A tuple containing the skew factors for
                                         (XY_skew_factor, XZ_skew_factor, YZ_skew_factor).
         """
-        return self.marlin_I, self.marlin_J, self.marlin_K
+        return self._factors_tuple
 
     def get_marlin_command(self) -> str:
         """
@@ -142,7 +148,9 @@ class SkewCalculator:
             str: The M852 command string (e.g., "M852 I0.00 J0.00 K0.00 ; PrintSkewCompensation").
                  Returns an error message if factors could not be calculated.
         """
-        return f"M852 I{self.marlin_I:.8f} J{self.marlin_J:.8f} K{self.marlin_K:.8f} ; {PluginConstants.PLUGIN_ID}"
+        if self._marlin_cmd_cache is None:
+            self._marlin_cmd_cache = f"M852 I{self.marlin_I:.8f} J{self.marlin_J:.8f} K{self.marlin_K:.8f} ; {PluginConstants.PLUGIN_ID}"
+        return self._marlin_cmd_cache
 
     def get_klipper_command(self) -> str:
         """
@@ -153,13 +161,12 @@ class SkewCalculator:
 
         Returns:
             str: The SET_SKEW command string (e.g., "SET_SKEW XY=141.42,141.42,100.00 XZ=... YZ=... ; PrintSkewCompensation").
-                 Returns an error message if measurement data is invalid or missing.
         """
-        try:
-            xy_part = f"XY={float(self.xy_ac):.3f},{float(self.xy_bd):.3f},{float(self.xy_ad):.3f}"
-            xz_part = f"XZ={float(self.xz_ac):.3f},{float(self.xz_bd):.3f},{float(self.xz_ad):.3f}"
-            yz_part = f"YZ={float(self.yz_ac):.3f},{float(self.yz_bd):.3f},{float(self.yz_ad):.3f}"
-            return f"SET_SKEW {xy_part} {xz_part} {yz_part} ; {PluginConstants.PLUGIN_ID}"
-        except (ValueError, TypeError) as e:
-            Logger.log("w", f"Could not format Klipper command due to invalid measurement type: {e}")
-            return f"SET_SKEW ; Error: Invalid measurements ({PluginConstants.PLUGIN_ID})"
+        if self._klipper_cmd_cache is None:
+            self._klipper_cmd_cache = (
+                f"SET_SKEW XY={self.xy_ac:.3f},{self.xy_bd:.3f},{self.xy_ad:.3f}"
+                f" XZ={self.xz_ac:.3f},{self.xz_bd:.3f},{self.xz_ad:.3f}"
+                f" YZ={self.yz_ac:.3f},{self.yz_bd:.3f},{self.yz_ad:.3f}"
+                f" ; {PluginConstants.PLUGIN_ID}"
+            )
+        return self._klipper_cmd_cache
@@ -1,5 +1,6 @@
 import os
 import shutil
+import threading
 from UM.i18n import i18nCatalog
 from UM.Application import Application
 from UM.Resources import Resources
@@ -10,6 +11,14 @@ from .PluginConstants import PluginConstants
 
 catalog = i18nCatalog("cura")
 
+_SOURCE_SCRIPT_PATH = os.path.join(PluginConstants.PLUGIN_PATH, "scripts", f"{PluginConstants.POST_PROCESSING_SCRIPT_NAME}.py")
+# Stat of the bundled script, taken once per process; the file cannot change
+# while Cura runs, so repeated register() calls (plugin reloads) reuse it.
+_source_script_stat = None
+# Serializes installs so overlapping register() calls cannot interleave the
+# stat/copy sequence.
+_install_lock = threading.Lock()
+
 def getMetaData():
     """
     Provides metadata for the plugin.
@@ -33,8 +42,13 @@ def _install_post_processing_script():
     is different from the one bundled with the plugin (based on file size and modification time),
     it copies the bundled script to the destination.
     """
-    source_script_file_path = os.path.join(PluginConstants.PLUGIN_PATH, "scripts", f"{PluginConstants.POST_PROCESSING_SCRIPT_NAME}.py")
-    
+    with _install_lock:
+        _install_post_processing_script_locked()
+
+def _install_post_processing_script_locked():
+    """Performs the actual check-and-copy; callers must hold _install_lock."""
+    global _source_script_stat
+
     try:
         user_data_path = Resources.getDataStoragePath()
         if not user_data_path:
@@ -45,30 +59,37 @@ def _install_post_processing_script():
         Logger.logException("e", f"{PluginConstants.PLUGIN_ID}: Error getting Cura's data storage directory path: {e}")
         return
 
-    if not os.path.exists(source_script_file_path):
-        Logger.log("e", f"{PluginConstants.PLUGIN_ID}: Post-processing script not found at {source_script_file_path}")
-        Message(text=f"Post-processing script '{PluginConstants.POST_PROCESSING_SCRIPT_NAME}' was not found within the plugin files. It will not be installed.",
-                lifetime=10,
-                title=catalog.i18n("Plugin Script Missing"),
-                message_type=Message.MessageType.ERROR
-                ).show()
-        return
-    
+    if _source_script_stat is None:
+        try:
+            _source_script_stat = os.stat(_SOURCE_SCRIPT_PATH)
+        except OSError:
+            Logger.log("e", f"{PluginConstants.PLUGIN_ID}: Post-processing script not found at {_SOURCE_SCRIPT_PATH}")
+            Message(text=f"Post-processing script '{PluginConstants.POST_PROCESSING_SCRIPT_NAME}' was not found within the plugin files. It will not be installed.",
+                    lifetime=10,
+                    title=catalog.i18n("Plugin Script Missing"),
+                    message_type=Message.MessageType.ERROR
+                    ).show()
+            return
+    source_stat = _source_script_stat
+
     current_script_file_path = os.path.join(scripts_dir, f"{PluginConstants.POST_PROCESSING_SCRIPT_NAME}.py")
     try:
-        if not os.path.exists(scripts_dir):
-            os.makedirs(scripts_dir)
-            Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Created scripts directory at {scripts_dir}")
-        
-        if os.path.exists(current_script_file_path):
-            # Check if the file already exists and compare sizes and modification times
-            # to avoid unnecessary copying
-            source_stat = os.stat(source_script_file_path)
+        os.makedirs(scripts_dir, exist_ok=True)
+
+        # One stat answers both "does it exist" and "is it current";
+        # size and modification time decide whether to copy.
+        try:
             dest_stat = os.stat(current_script_file_path)
-            if source_stat.st_size == dest_stat.st_size and int(source_stat.st_mtime) == int(dest_stat.st_mtime):
-                return
-        
-        shutil.copy2(source_script_file_path, scripts_dir)
+        except FileNotFoundError:
+            dest_stat = None
+        if dest_stat is not None and source_stat.st_size == dest_stat.st_size and int(source_stat.st_mtime) == int(dest_stat.st_mtime):
+            return
+
+        # copyfile + explicit utime: copies the data and the one metadata
+        # field the up-to-date check reads, without copy2's extra stat,
+        # chmod and flag handling.
+        shutil.copyfile(_SOURCE_SCRIPT_PATH, current_script_file_path)
+        os.utime(current_script_file_path, (source_stat.st_atime, source_stat.st_mtime))
         Logger.log("i", f"{PluginConstants.PLUGIN_ID}: Successfully copied {PluginConstants.POST_PROCESSING_SCRIPT_NAME} to {scripts_dir}")
     except Exception as e:
         Logger.logException("e", f"{PluginConstants.PLUGIN_ID}: Error copying post-processing script: {e}")
@@ -88,6 +109,7 @@ def register(app: Application):
         dict: A dictionary containing the extension instance, mapping "extension" to the PluginController.
     """
     from .PluginController import PluginController
-    # Call the script installation function
-    _install_post_processing_script()
+    # Run the script install off the startup path; it is pure filesystem work
+    # and only needs to finish before the user first slices with the script.
+    threading.Thread(target=_install_post_processing_script, name="SkewPPInstall", daemon=True).start()
     return { "extension": PluginController() }
@@ -7,12 +7,16 @@ There are three main options:
     'Marlin' and 'Klipper':
         Will use the entered values to calculate the skew factors and then enter them into the StartUp Gcode.  For 'Marlin' that is an M852 line.  'Klipper' is 'SET_SKEW'.
 """
+import functools
 import math
 import json
-import configparser
 import os
 import hashlib
 import re
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from UM.Application import Application
 from ..Script import Script
@@ -23,7 +27,224 @@ from UM.Resources import Resources
 
 catalog = i18nCatalog("cura")
 
+# X/Y/Z coordinate tokens on a motion line, compiled once at import.
+_XYZ_RE = re.compile(r"([XYZ])(-?\d+\.?\d*)")
+# A whole G0/G1 motion line inside a layer block.
+_MOVE_LINE_RE = re.compile(r"^G[01][^\n]*", re.M)
+# The Z value of a motion line, for the per-layer entry-Z prescan. The
+# [^;\n] segment keeps the match on the code side of any inline comment.
+_MOVE_Z_RE = re.compile(r"^G[01][^;\n]*?Z(-?\d+\.?\d*)", re.M)
+# Printer-name sanitizing for the cfg file name, shared with the plugin side.
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9._-]')
+_COLLAPSE_RE = re.compile(r'_+')
+
+@functools.lru_cache(maxsize=16)
+def _sanitized_settings_file_name(printer_name: str) -> str:
+    """Builds the per-printer cfg file name; pure in its argument, so results are memoized."""
+    safe_name = _SANITIZE_RE.sub('_', printer_name)
+    safe_name = _COLLAPSE_RE.sub('_', safe_name).strip('_')
+    hash_part = hashlib.blake2s(printer_name.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{safe_name}_{hash_part}.cfg"
+
+@functools.lru_cache(maxsize=16)
+def _legacy_settings_file_name(printer_name: str) -> str:
+    """The pre-blake2s (SHA-256) cfg file name, read if the plugin has not migrated it yet."""
+    safe_name = _SANITIZE_RE.sub('_', printer_name)
+    safe_name = _COLLAPSE_RE.sub('_', safe_name).strip('_')
+    hash_part = hashlib.sha256(printer_name.encode('utf-8')).hexdigest()[:8]
+    return f"{safe_name}_{hash_part}.cfg"
+
+def _parse_settings_cfg(cfg_path: str) -> dict | None:
+    """Reads the key/value pairs of the [settings] section of a cfg file.
+
+    The files are written by the plugin itself with RawConfigParser, so the
+    grammar is just one section of ``key = value`` lines; this reads exactly
+    that, without configparser's interpolation, DEFAULT-section and
+    continuation-line machinery.
+
+    Returns:
+        dict | None: The raw string values, or None if the file has no
+                     [settings] section.
+    """
+    values = None
+    in_section = False
+    with open(cfg_path, encoding='utf-8') as cfg_file:
+        for line in cfg_file:
+            line = line.strip()
+            if not line or line[0] in '#;':
+                continue
+            if line[0] == '[':
+                in_section = line == '[settings]'
+                if in_section and values is None:
+                    values = {}
+                continue
+            if in_section:
+                key, sep, value = line.partition('=')
+                if sep:
+                    values[key.strip().lower()] = value.strip()
+    return values
+
+# Optional Numba JIT for the per-layer transform. The kernel has to live in
+# this file because the plugin installs only this one script into Cura's
+# scripts directory; a helper module would not be copied along. Without
+# numba the NumPy path below is used instead.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _skew_kernel(xs, ys, zs, fxy, fxz, fyz, out_x, out_y):
+        # No rounding here: the writer formats with :.3f, which rounds.
+        for i in range(xs.shape[0]):
+            out_x[i] = xs[i] - ys[i] * fxy - zs[i] * fxz
+            out_y[i] = ys[i] - zs[i] * fyz
+else:
+    _skew_kernel = None
+
+# Parsed per-printer settings keyed by cfg path as (mtime_ns, settings dict);
+# a matching mtime means the dict can be reused without touching the disk.
+_CFG_CACHE = {}
+
+# Factors smaller than this cannot move any coordinate by the 0.0005 mm it
+# takes to change a 3-decimal output value on any realistic bed size, so the
+# per-axis rewrite is skipped for them — and when all three are this small,
+# the whole g-code walk is.
+_NEGLIGIBLE_FACTOR = 1e-7
+
+# Settings/factor comment block appended to the end of the g-code; filled in
+# by name from the plugin settings plus the calculated factors.
+_TRAILER_TEMPLATE = (
+    ";  Print Skew Compensation Settings:\n"
+    ";    xy_ac_measurement: {xy_ac_measurement}\n"
+    ";    xy_bd_measurement: {xy_bd_measurement}\n"
+    ";    xy_ad_measurement: {xy_ad_measurement}\n"
+    ";        XY skew factor:    {xy_skew_factor}\n"
+    ";    xz_ac_measurement: {xz_ac_measurement}\n"
+    ";    xz_bd_measurement: {xz_bd_measurement}\n"
+    ";    xz_ad_measurement: {xz_ad_measurement}\n"
+    ";        XZ skew factor:    {xz_skew_factor}\n"
+    ";    yz_ac_measurement: {yz_ac_measurement}\n"
+    ";    yz_bd_measurement: {yz_bd_measurement}\n"
+    ";    yz_ad_measurement: {yz_ad_measurement}\n"
+    ";        YZ skew factor:    {yz_skew_factor}\n"
+)
+
+def _compensate_layer(layer, entry_z, fxy, fxz, fyz, rewrite_x, rewrite_y, skew_matrix):
+    """Rewrites the motion lines of one layer block.
+
+    Once entry_z (the modal Z carried in from the preceding layers) is
+    known, a layer depends on nothing outside itself, so callers may run
+    this for many layers concurrently.
+
+    Returns:
+        str | None: The rewritten layer, or None when nothing changed.
+    """
+    find_tokens = _XYZ_RE.finditer
+    # Z is modal and carries across lines; X/Y default to 0 on lines that
+    # omit them.
+    z_run = entry_z
+    # Pass 1: tokenize the motion lines into parallel value lists, straight
+    # from the layer string — no split into a line list. One compiled-regex
+    # scan per line replaces the three getValue substring searches; X/Y
+    # spans are recorded as offsets into the layer so the rewrite can
+    # splice the whole block in one go.
+    x_spans = []
+    y_spans = []
+    x_vals = []
+    y_vals = []
+    z_vals = []
+    # Bound methods, looked up once per layer instead of per line.
+    add_x_span = x_spans.append
+    add_y_span = y_spans.append
+    add_x = x_vals.append
+    add_y = y_vals.append
+    add_z = z_vals.append
+    for move in _MOVE_LINE_RE.finditer(layer):
+        base = move.start()
+        # Tokens after a ";" are comment text, not coordinates; getValue
+        # ignored them and so must this scan. First match per axis wins,
+        # again matching getValue.
+        code = move.group(0)
+        comment_start = code.find(';')
+        if comment_start != -1:
+            code = code[:comment_start]
+        x_span = None
+        y_span = None
+        x_val = 0.0
+        y_val = 0.0
+        z_val = None
+        for match in find_tokens(code):
+            axis = match.group(1)
+            if axis == "X":
+                if x_span is None:
+                    start, end = match.span(2)
+                    x_span = (base + start, base + end)
+                    x_val = float(match.group(2))
+            elif axis == "Y":
+                if y_span is None:
+                    start, end = match.span(2)
+                    y_span = (base + start, base + end)
+                    y_val = float(match.group(2))
+            elif z_val is None:
+                z_val = float(match.group(2))
+        if z_val is not None:
+            z_run = z_val
+        add_x_span(x_span)
+        add_y_span(y_span)
+        add_x(x_val)
+        add_y(y_val)
+        add_z(z_run)
+
+    if not x_vals:
+        return None
+
+    # Pass 2: one vectorized transform for the whole layer.
+    xs = np.array(x_vals, dtype=np.float64)
+    ys = np.array(y_vals, dtype=np.float64)
+    zs = np.array(z_vals, dtype=np.float64)
+    if _skew_kernel is not None:
+        x_arr = np.empty_like(xs)
+        y_arr = np.empty_like(ys)
+        _skew_kernel(xs, ys, zs, fxy, fxz, fyz, x_arr, y_arr)
+        x_out = x_arr.tolist()
+        y_out = y_arr.tolist()
+    else:
+        out = np.column_stack((xs, ys, zs)) @ skew_matrix.T
+        x_out = out[:, 0].tolist()
+        y_out = out[:, 1].tolist()
+
+    # Pass 3: splice the whole layer in one go from slices around the
+    # recorded token spans — no re-scanning, no split/join round trip, and
+    # a value like "X10" can never collide with an "X100" later in the
+    # line. Spans of successive moves already ascend; only X and Y within
+    # one move may need ordering.
+    replacements = []
+    add_replacement = replacements.append
+    # :.3f both rounds and stringifies in one step, so the transform above
+    # stays unrounded and repr() is never involved.
+    for i in range(len(x_vals)):
+        if rewrite_x and x_spans[i] is not None:
+            add_replacement((x_spans[i], f"{x_out[i]:.3f}"))
+        if rewrite_y and y_spans[i] is not None:
+            add_replacement((y_spans[i], f"{y_out[i]:.3f}"))
+    if not replacements:
+        return None
+    replacements.sort()
+    pieces = []
+    last = 0
+    for (start, end), text in replacements:
+        pieces.append(layer[last:start])
+        pieces.append(text)
+        last = end
+    pieces.append(layer[last:])
+    return "".join(pieces)
+
 class PrintSkewCompensationCKM(Script):
+    # Index order of the skew-factor array and the settings-key prefixes.
+    _PLANES = ("xy", "xz", "yz")
+
     def __init__(self):
         super().__init__()
         self._application = Application.getInstance()
@@ -33,11 +254,10 @@ class PrintSkewCompensationCKM(Script):
         self.script_key = "PrintSkewCompensationCKM"
         self._plugin_settings = self._get_default_settings()
         self.found_in_configuration = False
-        self._calculated_factors = {
-            "xy": 0.0,
-            "xz": 0.0,
-            "yz": 0.0
-        }
+        # Skew factors in _PLANES order (xy, xz, yz). The shape never
+        # changes, so a fixed-shape array replaces the former dict and its
+        # per-lookup hashing.
+        self._factors = np.zeros(3)
     
     def _get_default_settings(self) -> dict:
         return {
@@ -58,28 +278,53 @@ class PrintSkewCompensationCKM(Script):
         }
     
     def _read_printer_settings_from_file(self, printer_name) -> dict:
-        """Reads printer settings from the plugin's configuration file for the given printer name."""
+        """Reads printer settings from the plugin's configuration file for the given printer name.
+
+        Parsed files are cached against their mtime, with values already
+        coerced to the type of the matching default, so repeated execute()
+        calls skip both the disk read and the per-setting conversions.
+        Callers must treat the returned dict as read-only.
+        """
         cfg_path = self._get_printer_cfg_path(printer_name)
-        if not os.path.exists(cfg_path):
+        if cfg_path is None:
+            return self._get_default_settings()
+        try:
+            mtime_ns = os.stat(cfg_path).st_mtime_ns
+        except OSError:
             Logger.log("w", f"{self.script_key}: Printer settings file does not exist: {cfg_path}. Using default settings.")
             return self._get_default_settings()
 
-        config = configparser.ConfigParser()
-        config.read(cfg_path)
+        cached = _CFG_CACHE.get(cfg_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        if 'settings' not in config:
+        try:
+            raw_values = _parse_settings_cfg(cfg_path)
+        except (OSError, UnicodeDecodeError):
+            Logger.log("w", f"{self.script_key}: Could not read printer settings file: {cfg_path}. Using default settings.")
+            return self._get_default_settings()
+
+        if raw_values is None:
             Logger.log("w", f"{self.script_key}: No 'settings' section found in {cfg_path}. Using default settings.")
             return self._get_default_settings()
 
-        settings = {k: v for k, v in config['settings'].items()}
+        defaults = self._get_default_settings()
+        settings = {}
+        for key, value in raw_values.items():
+            default = defaults.get(key)
+            if isinstance(default, bool):
+                settings[key] = str(value).lower() == 'true'
+            elif isinstance(default, float):
+                try:
+                    settings[key] = float(value)
+                except ValueError:
+                    Logger.log("w", f"{self.script_key}: Invalid float value for setting '{key}': '{value}'. Using default.")
+                    settings[key] = default
+            else:
+                settings[key] = value
+        _CFG_CACHE[cfg_path] = (mtime_ns, settings)
         return settings
     
-    def _sanitized_settings_file_name(self, printer_name) -> str:
-        safe_name = re.sub(r'[^a-zA-Z0-9._-]', '_', printer_name)
-        safe_name = re.sub(r'_+', '_', safe_name).strip('_')
-        hash_part = hashlib.sha256(printer_name.encode('utf-8')).hexdigest()[:8]
-        return f"{safe_name}_{hash_part}.cfg"
-
     def _get_current_printer_name(self) -> str:
         """Returns the name of the currently active printer."""
         stack = self._application.getGlobalContainerStack()
@@ -92,99 +337,50 @@ class PrintSkewCompensationCKM(Script):
         if not printer_name:
             Logger.log("e", f"{self.script_key}: Printer name is empty, cannot determine config path.")
             return None
-        printer_file_name = self._sanitized_settings_file_name(printer_name)
-        plugin_path = os.path.join(self.cura_configuration_path, "plugins", "PrintSkewCompensation")
-        cfg_path = os.path.join(plugin_path, "configuration", printer_file_name)
+        configuration_dir = os.path.join(self.cura_configuration_path, "plugins", "PrintSkewCompensation", "configuration")
+        cfg_path = os.path.join(configuration_dir, _sanitized_settings_file_name(printer_name))
+        if not os.path.exists(cfg_path):
+            # The plugin migrates old SHA-256-named files on save; until a
+            # printer has been saved again, its settings still live there.
+            legacy_path = os.path.join(configuration_dir, _legacy_settings_file_name(printer_name))
+            if os.path.exists(legacy_path):
+                return legacy_path
         return cfg_path
     
-    def _calculate_factors_from_configuration(self):
-        # XY Axis - Calculate only if measurements are valid
-        current_printer_name = self._get_current_printer_name()
-        self._plugin_settings = self._read_printer_settings_from_file(current_printer_name)
-        
-        raw_comp_enabled_value = self._plugin_settings.get("compensation_enabled", False)
-        if isinstance(raw_comp_enabled_value, str):
-            self._plugin_enabled = raw_comp_enabled_value.lower() == 'true'
-        else:
-            self._plugin_enabled = bool(raw_comp_enabled_value) # Ensures it's a proper boolean if it was already (e.g. from defaults)
-        
-        def get_float_setting(key_name: str) -> float | None:
-            """Safely retrieves and converts a setting to float."""
-            str_value = self._plugin_settings.get(key_name)
-            if str_value is None:
-                # Logger.log("d", f"[{self.script_key}] Setting '{key_name}' not found in configuration.")
-                return None
-            try:
-                return float(str_value)
-            except ValueError:
-                Logger.log("w", f"[{self.script_key}] Invalid float value for setting '{key_name}': '{str_value}'. Using None.")
-                return None
-
-        xy_ac = get_float_setting("xy_ac_measurement")
-        xy_bd = get_float_setting("xy_bd_measurement")
-        xy_ad = get_float_setting("xy_ad_measurement")
-
-        if None not in [xy_ac, xy_bd, xy_ad]:
-            try:
-                self._calculated_factors["xy"] = self.calculate_skew_factor(
-                    xy_ac,
-                    xy_bd,
-                    xy_ad
-                )
-                Logger.log("i", f"[{self.script_key}] Calculated XY skew factor from configuration measurements: {self._calculated_factors['xy']}")
-                self._settings_source = "configuration (calculated)"
-                self.found_in_configuration = True
-            except Exception as e_xy_calc:
-                Logger.log("w", f"[{self.script_key}] Could not calculate XY factor from configuration measurements: {e_xy_calc}")
-                self._calculated_factors["xy"] = 0.0
-        else:
-             self._calculated_factors["xy"] = 0.0
-
-        # XZ Axis - Calculate only if measurements are valid
-        xz_ac = get_float_setting("xz_ac_measurement")
-        xz_bd = get_float_setting("xz_bd_measurement")
-        xz_ad = get_float_setting("xz_ad_measurement")
-
-        if None not in [xz_ac, xz_bd, xz_ad]:
+    def _calculate_factors_from_configuration(self, printer_name: str = None):
+        """Loads the per-printer settings and derives the skew factor for each plane.
+
+        Args:
+            printer_name (str): Name of the printer whose settings to load.
+                                Resolved from the active container stack when omitted.
+        """
+        if printer_name is None:
+            printer_name = self._get_current_printer_name()
+        self._plugin_settings = self._read_printer_settings_from_file(printer_name)
+
+        # _read_printer_settings_from_file already coerced the values against
+        # the typed defaults, so the enable flag is a bool and the
+        # measurements below are floats — no per-key conversion needed here.
+        self._plugin_enabled = bool(self._plugin_settings.get("compensation_enabled", False))
+
+        settings = self._plugin_settings
+        for plane_index, plane in enumerate(self._PLANES):
+            measurements = (settings.get(f"{plane}_ac_measurement"),
+                            settings.get(f"{plane}_bd_measurement"),
+                            settings.get(f"{plane}_ad_measurement"))
+            if any(not isinstance(value, (int, float)) for value in measurements):
+                self._factors[plane_index] = 0.0
+                continue
             try:
-                self._calculated_factors["xz"] = self.calculate_skew_factor(
-                    xz_ac,
-                    xz_bd,
-                    xz_ad
-                )
-                Logger.log("i", f"[{self.script_key}] Calculated XZ skew factor from configuration measurements: {self._calculated_factors['xz']}")
-                # Don't overwrite settings_source if already set by XY
-                if self._settings_source == "configuration": self._settings_source = "configuration (calculated)" # Note: This condition might need review if settings_source can be None initially
-                elif self._settings_source is None: self._settings_source = "configuration (calculated)" # Ensure it's set if XY was skipped
-                self.found_in_configuration = True
-            except Exception as e_xz_calc:
-                Logger.log("w", f"[{self.script_key}] Could not calculate XZ factor from configuration measurements: {e_xz_calc}")
-                self._calculated_factors["xz"] = 0.0
-        else:
-             self._calculated_factors["xz"] = 0.0
-
-        # YZ Axis - Calculate only if measurements are valid
-        yz_ac = get_float_setting("yz_ac_measurement")
-        yz_bd = get_float_setting("yz_bd_measurement")
-        yz_ad = get_float_setting("yz_ad_measurement")
-
-        if None not in [yz_ac, yz_bd, yz_ad]:
-            try:
-                self._calculated_factors["yz"] = self.calculate_skew_factor(
-                    yz_ac,
-                    yz_bd,
-                    yz_ad
-                )
-                Logger.log("i", f"[{self.script_key}] Calculated YZ skew factor from configuration measurements: {self._calculated_factors['yz']}")
-                # Don't overwrite settings_source if already set by XY/XZ
-                if self._settings_source == "configuration": self._settings_source = "configuration (calculated)"
-                elif self._settings_source is None: self._settings_source = "configuration (calculated)" # Ensure it's set if XY/XZ were skipped
-                self.found_in_configuration = True
-            except Exception as e_yz_calc:
-                Logger.log("w", f"[{self.script_key}] Could not calculate YZ factor from configuration measurements: {e_yz_calc}")
-                self._calculated_factors["yz"] = 0.0
-        else:
-             self._calculated_factors["yz"] = 0.0
+                factor = self.calculate_skew_factor(*measurements)
+            except Exception as e_calc:
+                Logger.log("w", f"[{self.script_key}] Could not calculate {plane.upper()} factor from configuration measurements: {e_calc}")
+                self._factors[plane_index] = 0.0
+                continue
+            self._factors[plane_index] = factor
+            Logger.log("i", f"[{self.script_key}] Calculated {plane.upper()} skew factor from configuration measurements: {factor}")
+            self._settings_source = "configuration (calculated)"
+            self.found_in_configuration = True
 
         # If no factors were obtained from configuration, mark configurations as effectively disabled for factor calculation
         if not self.found_in_configuration and self._plugin_enabled:
@@ -192,7 +388,7 @@ class PrintSkewCompensationCKM(Script):
             self._plugin_enabled = False # Treat as disabled for factor calculation purposes
         elif not self._plugin_enabled:
              # Ensure factors are zero if configurations were disabled from the start
-             self._calculated_factors = {"xy": 0.0, "xz": 0.0, "yz": 0.0}
+             self._factors[:] = 0.0
 
     def getSettingDataString(self):
         
@@ -250,21 +446,24 @@ class PrintSkewCompensationCKM(Script):
                             message_type=Message.MessageType.WARNING).show()
                 break           
         
-        # Load settings from the plugin configuration file
-        self._calculate_factors_from_configuration()
+        # Load settings from the plugin configuration file; the printer name
+        # is resolved from the container stack once for the whole run.
+        self._calculate_factors_from_configuration(self._get_current_printer_name())
         enable_xy_skew = False
         enable_xz_skew = False
         enable_yz_skew = False
 
+        # One unpack to plain floats covers every factor read below.
+        factor_xy, factor_xz, factor_yz = self._factors.tolist()
         if self.found_in_configuration is True:
-            if self._calculated_factors["xy"] != 0:
+            if abs(factor_xy) > _NEGLIGIBLE_FACTOR:
                 enable_xy_skew = True
-            if self._calculated_factors["xz"] != 0:
+            if abs(factor_xz) > _NEGLIGIBLE_FACTOR:
                 enable_xz_skew = True
-            if self._calculated_factors["yz"] != 0:
+            if abs(factor_yz) > _NEGLIGIBLE_FACTOR:
                 enable_yz_skew = True
             if enable_xy_skew or enable_xz_skew or enable_yz_skew:
-                Logger.log("i", f"[{self.script_key}] Using factors calculated from configuration: XY={self._calculated_factors['xy']:.8f}, XZ={self._calculated_factors['xz']:.8f}, YZ={self._calculated_factors['yz']:.8f}")
+                Logger.log("i", f"[{self.script_key}] Using factors calculated from configuration: XY={factor_xy:.8f}, XZ={factor_xz:.8f}, YZ={factor_yz:.8f}")
             else:
                 Logger.log("i", f"[{self.script_key}] configuration enabled, but no factors applied (Zero skew factor).")
                 Message(text="The post processor did not receive a non-zero value from the plugin.",
@@ -282,23 +481,16 @@ class PrintSkewCompensationCKM(Script):
 
         data = self.cura_compensation(data)
 
-        # Add the skew factors to the end of the gcode
-        setting_string = (
-            f";  Print Skew Compensation Settings:\n"
-            f";    xy_ac_measurement: {self._plugin_settings.get('xy_ac_measurement')}\n"
-            f";    xy_bd_measurement: {self._plugin_settings.get('xy_bd_measurement')}\n"
-            f";    xy_ad_measurement: {self._plugin_settings.get('xy_ad_measurement')}\n"
-            f";        XY skew factor:    {round(self._calculated_factors['xy'], 8)}\n"
-            f";    xz_ac_measurement: {self._plugin_settings.get('xz_ac_measurement')}\n"
-            f";    xz_bd_measurement: {self._plugin_settings.get('xz_bd_measurement')}\n"
-            f";    xz_ad_measurement: {self._plugin_settings.get('xz_ad_measurement')}\n"
-            f";        XZ skew factor:    {round(self._calculated_factors['xz'], 8)}\n"
-            f";    yz_ac_measurement: {self._plugin_settings.get('yz_ac_measurement')}\n"
-            f";    yz_bd_measurement: {self._plugin_settings.get('yz_bd_measurement')}\n"
-            f";    yz_ad_measurement: {self._plugin_settings.get('yz_ad_measurement')}\n"
-            f";        YZ skew factor:    {round(self._calculated_factors['yz'], 8)}\n"
-        )
-        data[len(data) - 1] += setting_string
+        # Add the skew factors to the end of the gcode. The defaults layer
+        # keeps format_map total even if a measurement key is missing from
+        # the settings file.
+        factor_fields = {
+            "xy_skew_factor": round(factor_xy, 8),
+            "xz_skew_factor": round(factor_xz, 8),
+            "yz_skew_factor": round(factor_yz, 8),
+        }
+        trailer_values = ChainMap(factor_fields, self._plugin_settings, self._get_default_settings())
+        data[len(data) - 1] += _TRAILER_TEMPLATE.format_map(trailer_values)
 
         return data
 
@@ -306,73 +498,65 @@ class PrintSkewCompensationCKM(Script):
         if ac <= 0 or bd <= 0 or ad <= 0:
             Logger.log("w", f"[Print Skew Compensation] Invalid measurement(s) for calculation: AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
             return 0.0
-        try:
-            term_sqrt = 2*ac*ac + 2*bd*bd - 4*ad*ad
-            if term_sqrt < 0:
-                 Logger.log("w", f"[Print Skew Compensation] Invalid measurements leading to negative sqrt term ({term_sqrt}). Check calibration print measurements. AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
-                 return 0.0
-            ab = math.sqrt(term_sqrt) / 2
-
-            denominator_acos = 2 * ab * ad
-            if denominator_acos == 0:
-                Logger.log("w", f"[Print Skew Compensation] Invalid measurements leading to zero denominator in acos. Check calibration print measurements. AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
-                return 0.0
-
-            arg_acos = (ac*ac - ab*ab - ad*ad) / denominator_acos
-            if not (-1 <= arg_acos <= 1):
-                 Logger.log("w", f"[Print Skew Compensation] Invalid measurements leading to acos argument out of range ({arg_acos}). Check calibration print measurements. AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
-                 return 0.0
-
-            skew_comp = math.tan(math.pi/2 - math.acos(arg_acos))
-            return skew_comp
-        except ValueError as e:
-            Logger.log("e", f"[Print Skew Compensation] Math error during skew calculation: {e}. Measurements: AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
+        term_sqrt = 2*ac*ac + 2*bd*bd - 4*ad*ad
+        if term_sqrt <= 0:
+            # Covers both the negative-sqrt and zero-AB (zero acos denominator) cases.
+            Logger.log("w", f"[Print Skew Compensation] Invalid measurements leading to non-positive sqrt term ({term_sqrt}). Check calibration print measurements. AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
             return 0.0
-        except Exception as e:
-             Logger.log("e", f"[Print Skew Compensation] Unexpected error during skew calculation: {e}. Measurements: AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
-             return 0.0
-
-    def cura_compensation(self, cura_data: str) -> str:
-        # z_input is cummulative
-        z_input = 0
-        cur_x = 0
-        cur_y = 0
-        cur_z = 0
-        for layer_index, layer in enumerate(cura_data):
-            lines = layer.split("\n")
-
-            # Get the X, Y, Z locations
-            for index, line in enumerate(lines):
-                if line.startswith(("G0", "G1")):
-                    cur_x = self.getValue(line, "X", None)
-                    cur_y = self.getValue(line, "Y", None)
-                    cur_z = self.getValue(line, "Z", None)
-
-                    # Reset x_input and y_input every time through
-                    x_input = 0
-                    y_input = 0
-
-                    # Equivalencies to avoid confusion
-                    if cur_x != None:
-                        x_input = cur_x
-                    if cur_y != None:
-                        y_input = cur_y
-                    if cur_z != None:
-                        z_input = cur_z
-
-                    # Calculate the skew compensation
-                    x_out = round(x_input - y_input * self._calculated_factors["xy"], 3)
-                    x_out = round(x_out - z_input * self._calculated_factors["xz"], 3)
-                    y_out = round(y_input - z_input * self._calculated_factors["yz"], 3)
-
-                    # If the first layer hasn't started then jump out (after tracking the XYZ).
-                    if layer_index < 2:
-                        continue
-
-                    # Alter the current line
-                    if cur_x != None:
-                        lines[index] = lines[index].replace(f"X{cur_x}", f"X{x_out}")
-                    if cur_y != None:
-                        lines[index] = lines[index].replace(f"Y{cur_y}", f"Y{y_out}")
-            cura_data[layer_index] = "\n".join(lines)
+        ab = math.sqrt(term_sqrt) / 2
+
+        arg = (ac*ac - ab*ab - ad*ad) / (2 * ab * ad)
+        if not (-1 < arg < 1):
+            # |arg| == 1 means a degenerate (fully collapsed) parallelogram;
+            # the old tan(pi/2 - acos(1)) silently blew up to ~1e16 here.
+            Logger.log("w", f"[Print Skew Compensation] Invalid measurements leading to acos argument out of range ({arg}). Check calibration print measurements. AC={ac}, BD={bd}, AD={ad}. Returning 0 skew factor.")
+            return 0.0
+
+        # tan(pi/2 - acos(x)) == x / sqrt(1 - x*x): one sqrt and a divide
+        # instead of two transcendental calls, with no domain error possible
+        # after the range check above.
+        return arg / math.sqrt(1.0 - arg * arg)
+
+    def cura_compensation(self, cura_data: list) -> list:
+        # Factors as plain floats, hoisted out of the per-layer work below.
+        fxy, fxz, fyz = self._factors.tolist()
+        # Axes whose factors are all negligible come out of the transform
+        # unchanged, so their tokens never need rewriting (the common case is
+        # XY-only compensation, which leaves every Y untouched).
+        rewrite_x = abs(fxy) > _NEGLIGIBLE_FACTOR or abs(fxz) > _NEGLIGIBLE_FACTOR
+        rewrite_y = abs(fyz) > _NEGLIGIBLE_FACTOR
+        # The whole transform as one 2x3 matrix applied to (x, y, z):
+        # x' = x - y*fxy - z*fxz, y' = y - z*fyz.
+        skew_matrix = np.array(((1.0, -fxy, -fxz), (0.0, 1.0, -fyz)), dtype=np.float64)
+
+        # Z is modal and carries across lines and layers, which is the one
+        # dependency between layers. A cheap Z-only prescan resolves it up
+        # front: entry_zs[i] is the modal Z in effect when layer i starts,
+        # after which every layer can be rewritten independently.
+        entry_zs = []
+        entry_z = 0.0
+        for layer in cura_data:
+            entry_zs.append(entry_z)
+            last_z = None
+            for match in _MOVE_Z_RE.finditer(layer):
+                last_z = match.group(1)
+            if last_z is not None:
+                entry_z = float(last_z)
+
+        def compensate(layer_index: int):
+            return _compensate_layer(cura_data[layer_index], entry_zs[layer_index],
+                                     fxy, fxz, fyz, rewrite_x, rewrite_y, skew_matrix)
+
+        # Header and StartUp blocks (indices 0 and 1) are never rewritten;
+        # they only feed the Z prescan above.
+        layer_indices = range(2, len(cura_data))
+        if len(layer_indices) < 8:
+            # Not worth spinning up a pool for a handful of layers.
+            results = map(compensate, layer_indices)
+        else:
+            with ThreadPoolExecutor() as pool:
+                results = list(pool.map(compensate, layer_indices))
+        for layer_index, new_layer in zip(layer_indices, results):
+            if new_layer is not None:
+                cura_data[layer_index] = new_layer
         return cura_data